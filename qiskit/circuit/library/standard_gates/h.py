@@ -46,6 +46,9 @@ class HGate(Gate):
                 1 & -1
             \end{pmatrix}
     """
+    # Define class constants. This saves future allocation time.
+    _matrix = numpy.array([[1, 1], [1, -1]]) / numpy.sqrt(2)
+    _is_self_inverse = True
 
     def __init__(self, label=None):
         """Create new H gate."""
@@ -93,7 +96,7 @@ class HGate(Gate):
 
     def __array__(self, dtype=None):
         """Return a Numpy.array for the H gate."""
-        return numpy.array([[1, 1], [1, -1]], dtype=dtype) / numpy.sqrt(2)
+        return numpy.array(self._matrix, dtype=dtype)
 
 
 class CHGate(ControlledGate):
@@ -157,6 +160,7 @@ class CHGate(ControlledGate):
         [[_sqrt2o2, 0, _sqrt2o2, 0], [0, 1, 0, 0], [_sqrt2o2, 0, -_sqrt2o2, 0], [0, 0, 0, 1]],
         dtype=complex,
     )
+    _is_self_inverse = True
 
     def __init__(self, label=None, ctrl_state=None):
         """Create new CH gate."""
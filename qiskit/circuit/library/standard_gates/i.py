@@ -38,6 +38,9 @@ class IGate(Gate):
         q_0: ┤ I ├
              └───┘
     """
+    # Define class constants. This saves future allocation time.
+    _matrix = numpy.array([[1, 0], [0, 1]])
+    _is_self_inverse = True
 
     def __init__(self, label=None):
         """Create new Identity gate."""
@@ -49,4 +52,4 @@ class IGate(Gate):
 
     def __array__(self, dtype=None):
         """Return a numpy.array for the identity gate."""
-        return numpy.array([[1, 0], [0, 1]], dtype=dtype)
+        return numpy.array(self._matrix, dtype=dtype)
@@ -115,6 +115,10 @@ class PhaseGate(Gate):
         lam = float(self.params[0])
         return numpy.array([[1, 0], [0, numpy.exp(1j * lam)]], dtype=dtype)
 
+    def _diagonal(self):
+        """Return the diagonal of the Phase gate matrix."""
+        return numpy.array([1, numpy.exp(1j * float(self.params[0]))])
+
 
 class CPhaseGate(ControlledGate):
     r"""Controlled-Phase gate.
@@ -12,6 +12,8 @@
 
 """Rotation around an axis in x-y plane."""
 
+import cmath
+import functools
 import math
 import numpy
 from qiskit.qasm import pi
@@ -42,6 +44,8 @@ class RGate(Gate):
                 -i e^{i \phi} \sin{\th} & \cos{\th}
             \end{pmatrix}
     """
+    # Define class constants. This saves future allocation time.
+    _qreg = QuantumRegister(1, "q")
 
     def __init__(self, theta, phi):
         """Create new r single-qubit gate."""
@@ -55,7 +59,7 @@ class RGate(Gate):
         from qiskit.circuit.quantumcircuit import QuantumCircuit
         from .u3 import U3Gate
 
-        q = QuantumRegister(1, "q")
+        q = self._qreg
         qc = QuantumCircuit(q, name=self.name)
         theta = self.params[0]
         phi = self.params[1]
@@ -75,8 +79,47 @@ class RGate(Gate):
     def __array__(self, dtype=None):
         """Return a numpy.array for the R gate."""
         theta, phi = float(self.params[0]), float(self.params[1])
-        cos = math.cos(theta / 2)
-        sin = math.sin(theta / 2)
+        return numpy.array(_r_array(theta, phi), dtype=dtype)
+
+    @classmethod
+    def batch_matrices(cls, thetas, phis):
+        """Return the matrices of R gates for arrays of rotation angles.
+
+        This evaluates the trigonometric functions once over the whole arrays
+        instead of constructing a gate and its matrix for every pair of angles.
+
+        Args:
+            thetas (array_like): the rotation angles.
+            phis (array_like): the rotation axis angles, broadcast against ``thetas``.
+
+        Returns:
+            numpy.ndarray: complex array of shape ``shape + (2, 2)`` where ``shape``
+            is the broadcast shape of ``thetas`` and ``phis``.
+        """
+        half, phi = numpy.broadcast_arrays(
+            numpy.asarray(thetas, dtype=float) / 2, numpy.asarray(phis, dtype=float)
+        )
+        cos = numpy.cos(half)
+        isin = -1j * numpy.sin(half)
         exp_m = numpy.exp(-1j * phi)
-        exp_p = numpy.exp(1j * phi)
-        return numpy.array([[cos, -1j * exp_m * sin], [-1j * exp_p * sin, cos]], dtype=dtype)
+        mat = numpy.empty(half.shape + (2, 2), dtype=complex)
+        mat[..., 0, 0] = cos
+        mat[..., 0, 1] = exp_m * isin
+        mat[..., 1, 0] = exp_m.conj() * isin
+        mat[..., 1, 1] = cos
+        return mat
+
+
+@functools.lru_cache(maxsize=4096)
+def _r_array(theta, phi):
+    """Return a read-only R gate matrix, cached on the rotation angles."""
+    half_theta = theta / 2
+    cos = math.cos(half_theta)
+    isin = -1j * math.sin(half_theta)
+    exp_m = cmath.exp(-1j * phi)
+    mat = numpy.empty((2, 2), dtype=complex)
+    mat[0, 0] = mat[1, 1] = cos
+    mat[0, 1] = exp_m * isin
+    mat[1, 0] = exp_m.conjugate() * isin
+    mat.setflags(write=False)
+    return mat
@@ -91,9 +91,10 @@ class RXGate(Gate):
 
     def __array__(self, dtype=None):
         """Return a numpy.array for the RX gate."""
-        cos = math.cos(self.params[0] / 2)
-        sin = math.sin(self.params[0] / 2)
-        return numpy.array([[cos, -1j * sin], [-1j * sin, cos]], dtype=dtype)
+        half_theta = float(self.params[0]) / 2
+        cos = math.cos(half_theta)
+        isin = -1j * math.sin(half_theta)
+        return numpy.array([[cos, isin], [isin, cos]], dtype=dtype)
 
 
 class CRXGate(ControlledGate):
@@ -12,6 +12,8 @@
 
 """Two-qubit XX-rotation gate."""
 
+import functools
+import math
 from qiskit.circuit.gate import Gate
 from qiskit.circuit.quantumregister import QuantumRegister
 
@@ -65,6 +67,9 @@ class RXXGate(Gate):
                                         -i & 0  & 0  & 1
                                     \end{pmatrix}
     """
+    # Define class constants. This saves future allocation time.
+    _qreg = QuantumRegister(2, "q")
+    _pauli_string = "XX"
 
     def __init__(self, theta):
         """Create new RXX gate."""
@@ -79,7 +84,7 @@ class RXXGate(Gate):
         from .rz import RZGate
 
         theta = self.params[0]
-        q = QuantumRegister(2, "q")
+        q = self._qreg
         qc = QuantumCircuit(q, name=self.name)
         rules = [
             (HGate(), [q[0]], []),
@@ -95,6 +100,20 @@ class RXXGate(Gate):
 
         self.definition = qc
 
+    def to_pauli_rotation(self):
+        r"""Return the gate as a Pauli rotation :math:`exp(-i \frac{\theta}{2} XX)`.
+
+        Simulators with a native Pauli-rotation kernel can apply the gate
+        directly instead of applying its decomposition.
+
+        Returns:
+            tuple: the Pauli label ``"XX"`` and the rotation angle as a float.
+
+        Raises:
+            TypeError: if the rotation angle is an unbound parameter.
+        """
+        return self._pauli_string, float(self.params[0])
+
     def inverse(self):
         """Return inverse RXX gate (i.e. with the negative rotation angle)."""
         return RXXGate(-self.params[0])
@@ -103,10 +122,52 @@ class RXXGate(Gate):
         """Return a Numpy.array for the RXX gate."""
         import numpy
 
-        theta2 = float(self.params[0]) / 2
-        cos = numpy.cos(theta2)
-        isin = 1j * numpy.sin(theta2)
-        return numpy.array(
-            [[cos, 0, 0, -isin], [0, cos, -isin, 0], [0, -isin, cos, 0], [-isin, 0, 0, cos]],
-            dtype=dtype,
-        )
+        return numpy.array(_rxx_array(float(self.params[0])), dtype=dtype)
+
+    def _partials(self):
+        r"""Return the coefficients ``(c, s)`` such that :math:`R_{XX} = c I + s X{\otimes}X`."""
+        return _rxx_partials(float(self.params[0]))
+
+    @classmethod
+    def batch_matrices(cls, thetas):
+        """Return the matrices of RXX gates for an array of rotation angles.
+
+        This evaluates the trigonometric functions once over the whole array
+        instead of constructing a gate and its matrix for every angle.
+
+        Args:
+            thetas (array_like): the rotation angles.
+
+        Returns:
+            numpy.ndarray: complex array of shape ``numpy.shape(thetas) + (4, 4)``.
+        """
+        import numpy
+
+        half = numpy.asarray(thetas, dtype=float) / 2
+        cos = numpy.cos(half)
+        isin = -1j * numpy.sin(half)
+        mat = numpy.zeros(half.shape + (4, 4), dtype=complex)
+        for i in range(4):
+            mat[..., i, i] = cos
+            mat[..., i, 3 - i] = isin
+        return mat
+
+
+def _rxx_partials(theta):
+    """Return the identity and XX coefficients of an RXX gate matrix."""
+    half_theta = theta / 2
+    return math.cos(half_theta), -1j * math.sin(half_theta)
+
+
+@functools.lru_cache(maxsize=4096)
+def _rxx_array(theta):
+    """Return a read-only RXX gate matrix, cached on the rotation angle."""
+    import numpy
+
+    cos, isin = _rxx_partials(theta)
+    mat = numpy.zeros((4, 4), dtype=complex)
+    for i in range(4):
+        mat[i, i] = cos
+        mat[i, 3 - i] = isin
+    mat.setflags(write=False)
+    return mat
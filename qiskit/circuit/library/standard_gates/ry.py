@@ -12,6 +12,7 @@
 
 """Rotation around the Y axis."""
 
+import functools
 import math
 import numpy
 from qiskit.qasm import pi
@@ -43,6 +44,8 @@ class RYGate(Gate):
                 \sin{\th} & \cos{\th}
             \end{pmatrix}
     """
+    # Define class constants. This saves future allocation time.
+    _qreg = QuantumRegister(1, "q")
 
     def __init__(self, theta, label=None):
         """Create new RY gate."""
@@ -56,7 +59,7 @@ class RYGate(Gate):
         from qiskit.circuit.quantumcircuit import QuantumCircuit
         from .r import RGate
 
-        q = QuantumRegister(1, "q")
+        q = self._qreg
         qc = QuantumCircuit(q, name=self.name)
         rules = [(RGate(self.params[0], pi / 2), [q[0]], [])]
         for instr, qargs, cargs in rules:
@@ -91,9 +94,80 @@ class RYGate(Gate):
 
     def __array__(self, dtype=None):
         """Return a numpy.array for the RY gate."""
-        cos = math.cos(self.params[0] / 2)
-        sin = math.sin(self.params[0] / 2)
-        return numpy.array([[cos, -sin], [sin, cos]], dtype=dtype)
+        return numpy.array(_ry_array(float(self.params[0])), dtype=dtype)
+
+    @classmethod
+    def batch_matrices(cls, thetas):
+        """Return the matrices of RY gates for an array of rotation angles.
+
+        This evaluates the trigonometric functions once over the whole array
+        instead of constructing a gate and its matrix for every angle. If
+        `numba <https://numba.pydata.org>`__ is installed the matrices for
+        large arrays of angles are filled by a compiled, multi-threaded kernel.
+
+        Args:
+            thetas (array_like): the rotation angles.
+
+        Returns:
+            numpy.ndarray: complex array of shape ``numpy.shape(thetas) + (2, 2)``.
+        """
+        thetas = numpy.asarray(thetas, dtype=float)
+        # Small batches are not worth the numba import and thread pool startup
+        kernel = _ry_batch_kernel() if thetas.size >= _RY_BATCH_KERNEL_MIN_SIZE else None
+        if kernel is not None:
+            mat = numpy.empty((thetas.size, 2, 2), dtype=complex)
+            kernel(numpy.ascontiguousarray(thetas).reshape(-1), mat)
+            return mat.reshape(thetas.shape + (2, 2))
+
+        half = thetas / 2
+        cos = numpy.cos(half)
+        sin = numpy.sin(half)
+        mat = numpy.empty(half.shape + (2, 2), dtype=complex)
+        mat[..., 0, 0] = cos
+        mat[..., 0, 1] = -sin
+        mat[..., 1, 0] = sin
+        mat[..., 1, 1] = cos
+        return mat
+
+
+@functools.lru_cache(maxsize=4096)
+def _ry_array(theta):
+    """Return a read-only RY gate matrix, cached on the rotation angle."""
+    half_theta = theta / 2
+    cos = math.cos(half_theta)
+    sin = math.sin(half_theta)
+    mat = numpy.empty((2, 2))
+    mat[0, 0] = mat[1, 1] = cos
+    mat[0, 1] = -sin
+    mat[1, 0] = sin
+    mat.setflags(write=False)
+    return mat
+
+
+# Minimum number of angles for RYGate.batch_matrices to use the numba kernel
+_RY_BATCH_KERNEL_MIN_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=None)
+def _ry_batch_kernel():
+    """Return a numba compiled RY batch matrix kernel, or None if numba is not installed."""
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    @numba.njit(parallel=True, cache=True)
+    def kernel(thetas, out):
+        for i in numba.prange(thetas.shape[0]):
+            half = thetas[i] / 2
+            cos = math.cos(half)
+            sin = math.sin(half)
+            out[i, 0, 0] = cos
+            out[i, 0, 1] = -sin
+            out[i, 1, 0] = sin
+            out[i, 1, 1] = cos
+
+    return kernel
 
 
 class CRYGate(ControlledGate):
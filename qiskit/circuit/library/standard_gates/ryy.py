@@ -66,6 +66,7 @@ class RYYGate(Gate):
                                         i & 0 & 0 & 1
                                     \end{pmatrix}
     """
+    _pauli_string = "YY"
 
     def __init__(self, theta):
         """Create new RYY gate."""
@@ -96,6 +97,20 @@ class RYYGate(Gate):
 
         self.definition = qc
 
+    def to_pauli_rotation(self):
+        r"""Return the gate as a Pauli rotation :math:`exp(-i \frac{\theta}{2} YY)`.
+
+        Simulators with a native Pauli-rotation kernel can apply the gate
+        directly instead of applying its decomposition.
+
+        Returns:
+            tuple: the Pauli label ``"YY"`` and the rotation angle as a float.
+
+        Raises:
+            TypeError: if the rotation angle is an unbound parameter.
+        """
+        return self._pauli_string, float(self.params[0])
+
     def inverse(self):
         """Return inverse RYY gate (i.e. with the negative rotation angle)."""
         return RYYGate(-self.params[0])
@@ -107,6 +107,13 @@ class RZGate(Gate):
         ilam2 = 0.5j * float(self.params[0])
         return np.array([[np.exp(-ilam2), 0], [0, np.exp(ilam2)]], dtype=dtype)
 
+    def _diagonal(self):
+        """Return the diagonal of the RZ gate matrix."""
+        import numpy as np
+
+        exp_m = np.exp(-0.5j * float(self.params[0]))
+        return np.array([exp_m, exp_m.conjugate()])
+
 
 class CRZGate(ControlledGate):
     r"""Controlled-RZ gate.
@@ -12,6 +12,8 @@
 
 """Two-qubit ZZ-rotation gate."""
 
+import cmath
+import functools
 from qiskit.circuit.gate import Gate
 from qiskit.circuit.quantumregister import QuantumRegister
 
@@ -78,6 +80,9 @@ class RZZGate(Gate):
                                         0 & 0 & 0 & 1-i
                                     \end{pmatrix}
     """
+    # Define class constants. This saves future allocation time.
+    _qreg = QuantumRegister(2, "q")
+    _pauli_string = "ZZ"
 
     def __init__(self, theta):
         """Create new RZZ gate."""
@@ -92,7 +97,7 @@ class RZZGate(Gate):
         from .x import CXGate
         from .rz import RZGate
 
-        q = QuantumRegister(2, "q")
+        q = self._qreg
         theta = self.params[0]
         qc = QuantumCircuit(q, name=self.name)
         rules = [
@@ -105,6 +110,20 @@ class RZZGate(Gate):
 
         self.definition = qc
 
+    def to_pauli_rotation(self):
+        r"""Return the gate as a Pauli rotation :math:`exp(-i \frac{\theta}{2} ZZ)`.
+
+        Simulators with a native Pauli-rotation kernel can apply the gate
+        directly instead of applying its decomposition.
+
+        Returns:
+            tuple: the Pauli label ``"ZZ"`` and the rotation angle as a float.
+
+        Raises:
+            TypeError: if the rotation angle is an unbound parameter.
+        """
+        return self._pauli_string, float(self.params[0])
+
     def inverse(self):
         """Return inverse RZZ gate (i.e. with the negative rotation angle)."""
         return RZZGate(-self.params[0])
@@ -113,13 +132,55 @@ class RZZGate(Gate):
         """Return a numpy.array for the RZZ gate."""
         import numpy
 
-        itheta2 = 1j * float(self.params[0]) / 2
-        return numpy.array(
-            [
-                [numpy.exp(-itheta2), 0, 0, 0],
-                [0, numpy.exp(itheta2), 0, 0],
-                [0, 0, numpy.exp(itheta2), 0],
-                [0, 0, 0, numpy.exp(-itheta2)],
-            ],
-            dtype=dtype,
-        )
+        return numpy.array(_rzz_array(float(self.params[0])), dtype=dtype)
+
+    def _diagonal(self):
+        """Return the read-only diagonal of the RZZ gate matrix."""
+        return _rzz_diagonal(float(self.params[0]))
+
+    @classmethod
+    def batch_matrices(cls, thetas):
+        """Return the matrices of RZZ gates for an array of rotation angles.
+
+        The diagonal entries are computed with a single complex exponential
+        evaluated over the whole array; all other matrix entries are zero.
+
+        Args:
+            thetas (array_like): the rotation angles.
+
+        Returns:
+            numpy.ndarray: complex array of shape ``numpy.shape(thetas) + (4, 4)``.
+        """
+        import numpy
+
+        thetas = numpy.asarray(thetas, dtype=float)
+        exp_m = numpy.exp(-0.5j * thetas)
+        exp_p = exp_m.conj()
+        mat = numpy.zeros(thetas.shape + (4, 4), dtype=complex)
+        mat[..., 0, 0] = exp_m
+        mat[..., 1, 1] = exp_p
+        mat[..., 2, 2] = exp_p
+        mat[..., 3, 3] = exp_m
+        return mat
+
+
+@functools.lru_cache(maxsize=4096)
+def _rzz_diagonal(theta):
+    """Return the read-only RZZ gate matrix diagonal, cached on the rotation angle."""
+    import numpy
+
+    exp_m = cmath.exp(-0.5j * theta)
+    exp_p = exp_m.conjugate()
+    diag = numpy.array([exp_m, exp_p, exp_p, exp_m])
+    diag.setflags(write=False)
+    return diag
+
+
+@functools.lru_cache(maxsize=4096)
+def _rzz_array(theta):
+    """Return a read-only RZZ gate matrix, cached on the rotation angle."""
+    import numpy
+
+    mat = numpy.diag(_rzz_diagonal(theta))
+    mat.setflags(write=False)
+    return mat
@@ -44,6 +44,8 @@ class SGate(Gate):
 
     Equivalent to a :math:`\pi/2` radian rotation about the Z axis.
     """
+    # Define class constants. This saves future allocation time.
+    _matrix = numpy.array([[1, 0], [0, 1j]])
 
     def __init__(self, label=None):
         """Create new S gate."""
@@ -71,7 +73,7 @@ class SGate(Gate):
 
     def __array__(self, dtype=None):
         """Return a numpy.array for the S gate."""
-        return numpy.array([[1, 0], [0, 1j]], dtype=dtype)
+        return numpy.array(self._matrix, dtype=dtype)
 
 
 class SdgGate(Gate):
@@ -100,6 +102,8 @@ class SdgGate(Gate):
 
     Equivalent to a :math:`\pi/2` radian rotation about the Z axis.
     """
+    # Define class constants. This saves future allocation time.
+    _matrix = numpy.array([[1, 0], [0, -1j]])
 
     def __init__(self, label=None):
         """Create new Sdg gate."""
@@ -127,4 +131,4 @@ class SdgGate(Gate):
 
     def __array__(self, dtype=None):
         """Return a numpy.array for the Sdg gate."""
-        return numpy.array([[1, 0], [0, -1j]], dtype=dtype)
+        return numpy.array(self._matrix, dtype=dtype)
@@ -49,6 +49,7 @@ class SwapGate(Gate):
 
         |a, b\rangle \rightarrow |b, a\rangle
     """
+    _is_self_inverse = True
 
     def __init__(self, label=None):
         """Create new SWAP gate."""
@@ -200,6 +201,7 @@ class CSwapGate(ControlledGate):
             [0, 0, 0, 0, 0, 0, 0, 1],
         ]
     )
+    _is_self_inverse = True
 
     def __init__(self, label=None, ctrl_state=None):
         """Create new CSWAP gate."""
@@ -45,6 +45,8 @@ class TGate(Gate):
 
     Equivalent to a :math:`\pi/4` radian rotation about the Z axis.
     """
+    # Define class constants. This saves future allocation time.
+    _matrix = numpy.array([[1, 0], [0, (1 + 1j) / numpy.sqrt(2)]])
 
     def __init__(self, label=None):
         """Create new T gate."""
@@ -72,7 +74,7 @@ class TGate(Gate):
 
     def __array__(self, dtype=None):
         """Return a numpy.array for the T gate."""
-        return numpy.array([[1, 0], [0, (1 + 1j) / numpy.sqrt(2)]], dtype=dtype)
+        return numpy.array(self._matrix, dtype=dtype)
 
 
 class TdgGate(Gate):
@@ -101,6 +103,8 @@ class TdgGate(Gate):
 
     Equivalent to a :math:`\pi/2` radian rotation about the Z axis.
     """
+    # Define class constants. This saves future allocation time.
+    _matrix = numpy.array([[1, 0], [0, (1 - 1j) / numpy.sqrt(2)]])
 
     def __init__(self, label=None):
         """Create new Tdg gate."""
@@ -128,4 +132,4 @@ class TdgGate(Gate):
 
     def __array__(self, dtype=None):
         """Return a numpy.array for the inverse T gate."""
-        return numpy.array([[1, 0], [0, (1 - 1j) / numpy.sqrt(2)]], dtype=dtype)
+        return numpy.array(self._matrix, dtype=dtype)
@@ -12,6 +12,8 @@
 
 """Two-pulse single-qubit gate."""
 
+import cmath
+import math
 import numpy
 from qiskit.circuit.controlledgate import ControlledGate
 from qiskit.circuit.gate import Gate
@@ -98,14 +100,12 @@ class UGate(Gate):
     def __array__(self, dtype=None):
         """Return a numpy.array for the U gate."""
         theta, phi, lam = [float(param) for param in self.params]
+        cos = math.cos(theta / 2)
+        sin = math.sin(theta / 2)
+        exp_phi = cmath.exp(1j * phi)
+        exp_lam = cmath.exp(1j * lam)
         return numpy.array(
-            [
-                [numpy.cos(theta / 2), -numpy.exp(1j * lam) * numpy.sin(theta / 2)],
-                [
-                    numpy.exp(1j * phi) * numpy.sin(theta / 2),
-                    numpy.exp(1j * (phi + lam)) * numpy.cos(theta / 2),
-                ],
-            ],
+            [[cos, -exp_lam * sin], [exp_phi * sin, exp_phi * exp_lam * cos]],
             dtype=dtype,
         )
 
@@ -123,6 +123,10 @@ class U1Gate(Gate):
         lam = float(self.params[0])
         return numpy.array([[1, 0], [0, numpy.exp(1j * lam)]], dtype=dtype)
 
+    def _diagonal(self):
+        """Return the diagonal of the U1 gate matrix."""
+        return numpy.array([1, numpy.exp(1j * float(self.params[0]))])
+
 
 class CU1Gate(ControlledGate):
     r"""Controlled-U1 gate.
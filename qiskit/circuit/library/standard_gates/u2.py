@@ -12,11 +12,16 @@
 
 """One-pulse single-qubit gate."""
 
+import cmath
+import functools
+import math
 import numpy
 from qiskit.qasm import pi
 from qiskit.circuit.gate import Gate
 from qiskit.circuit.quantumregister import QuantumRegister
 
+_INV_SQRT2 = 1 / math.sqrt(2)
+
 
 class U2Gate(Gate):
     r"""Single-qubit rotation about the X+Z axis.
@@ -57,6 +62,8 @@ class U2Gate(Gate):
         U3 is a generalization of U2 that covers all single-qubit rotations,
         using two X90 pulses.
     """
+    # Define class constants. This saves future allocation time.
+    _qreg = QuantumRegister(1, "q")
 
     def __init__(self, phi, lam, label=None):
         """Create new U2 gate."""
@@ -67,7 +74,7 @@ class U2Gate(Gate):
         from qiskit.circuit.quantumcircuit import QuantumCircuit
         from .u3 import U3Gate
 
-        q = QuantumRegister(1, "q")
+        q = self._qreg
         qc = QuantumCircuit(q, name=self.name)
         rules = [(U3Gate(pi / 2, self.params[0], self.params[1]), [q[0]], [])]
         for instr, qargs, cargs in rules:
@@ -84,13 +91,20 @@ class U2Gate(Gate):
 
     def __array__(self, dtype=None):
         """Return a Numpy.array for the U2 gate."""
-        isqrt2 = 1 / numpy.sqrt(2)
         phi, lam = self.params
         phi, lam = float(phi), float(lam)
-        return numpy.array(
-            [
-                [isqrt2, -numpy.exp(1j * lam) * isqrt2],
-                [numpy.exp(1j * phi) * isqrt2, numpy.exp(1j * (phi + lam)) * isqrt2],
-            ],
-            dtype=dtype,
-        )
+        return numpy.array(_u2_array(phi, lam), dtype=dtype)
+
+
+@functools.lru_cache(maxsize=4096)
+def _u2_array(phi, lam):
+    """Return a read-only U2 gate matrix, cached on the rotation angles."""
+    exp_lam = cmath.exp(1j * lam)
+    exp_phi = cmath.exp(1j * phi)
+    mat = numpy.empty((2, 2), dtype=complex)
+    mat[0, 0] = _INV_SQRT2
+    mat[0, 1] = -exp_lam * _INV_SQRT2
+    mat[1, 0] = exp_phi * _INV_SQRT2
+    mat[1, 1] = exp_phi * exp_lam * _INV_SQRT2
+    mat.setflags(write=False)
+    return mat
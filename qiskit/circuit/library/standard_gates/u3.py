@@ -12,6 +12,8 @@
 
 """Two-pulse single-qubit gate."""
 
+import cmath
+import math
 import numpy
 from qiskit.circuit.controlledgate import ControlledGate
 from qiskit.circuit.gate import Gate
@@ -99,13 +101,12 @@ class U3Gate(Gate):
         """Return a Numpy.array for the U3 gate."""
         theta, phi, lam = self.params
         theta, phi, lam = float(theta), float(phi), float(lam)
-        cos = numpy.cos(theta / 2)
-        sin = numpy.sin(theta / 2)
+        cos = math.cos(theta / 2)
+        sin = math.sin(theta / 2)
+        exp_phi = cmath.exp(1j * phi)
+        exp_lam = cmath.exp(1j * lam)
         return numpy.array(
-            [
-                [cos, -numpy.exp(1j * lam) * sin],
-                [numpy.exp(1j * phi) * sin, numpy.exp(1j * (phi + lam)) * cos],
-            ],
+            [[cos, -exp_lam * sin], [exp_phi * sin, exp_phi * exp_lam * cos]],
             dtype=dtype,
         )
 
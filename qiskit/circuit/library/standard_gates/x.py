@@ -69,6 +69,9 @@ class XGate(Gate):
         |0\rangle \rightarrow |1\rangle \\
         |1\rangle \rightarrow |0\rangle
     """
+    # Define class constants. This saves future allocation time.
+    _matrix = numpy.array([[0, 1], [1, 0]])
+    _is_self_inverse = True
 
     def __init__(self, label=None):
         """Create new X gate."""
@@ -114,7 +117,7 @@ class XGate(Gate):
 
     def __array__(self, dtype=None):
         """Return a numpy.array for the X gate."""
-        return numpy.array([[0, 1], [1, 0]], dtype=dtype)
+        return numpy.array(self._matrix, dtype=dtype)
 
 
 class CXGate(ControlledGate):
@@ -175,6 +178,7 @@ class CXGate(ControlledGate):
     .. math::
         `|a, b\rangle \rightarrow |a, a \oplus b\rangle`
     """
+    _is_self_inverse = True
 
     def __init__(self, label=None, ctrl_state=None):
         """Create new CX gate."""
@@ -279,6 +283,7 @@ class CCXGate(ControlledGate):
                 \end{pmatrix}
 
     """
+    _is_self_inverse = True
 
     def __init__(self, label=None, ctrl_state=None):
         """Create new CCX gate."""
@@ -63,6 +63,9 @@ class YGate(Gate):
         |0\rangle \rightarrow i|1\rangle \\
         |1\rangle \rightarrow -i|0\rangle
     """
+    # Define class constants. This saves future allocation time.
+    _matrix = numpy.array([[0, -1j], [1j, 0]])
+    _is_self_inverse = True
 
     def __init__(self, label=None):
         """Create new Y gate."""
@@ -107,7 +110,7 @@ class YGate(Gate):
 
     def __array__(self, dtype=None):
         """Return a numpy.array for the Y gate."""
-        return numpy.array([[0, -1j], [1j, 0]], dtype=dtype)
+        return numpy.array(self._matrix, dtype=dtype)
 
 
 class CYGate(ControlledGate):
@@ -165,6 +168,7 @@ class CYGate(ControlledGate):
     # Define class constants. This saves future allocation time.
     _matrix1 = numpy.array([[1, 0, 0, 0], [0, 0, 0, -1j], [0, 0, 1, 0], [0, 1j, 0, 0]])
     _matrix0 = numpy.array([[0, 0, -1j, 0], [0, 1, 0, 0], [1j, 0, 0, 0], [0, 0, 0, 1]])
+    _is_self_inverse = True
 
     def __init__(self, label=None, ctrl_state=None):
         """Create new CY gate."""
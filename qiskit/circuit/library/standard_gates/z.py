@@ -61,6 +61,9 @@ class ZGate(Gate):
         |0\rangle \rightarrow |0\rangle \\
         |1\rangle \rightarrow -|1\rangle
     """
+    # Define class constants. This saves future allocation time.
+    _matrix = numpy.array([[1, 0], [0, -1]])
+    _is_self_inverse = True
 
     def __init__(self, label=None):
         """Create new Z gate."""
@@ -105,7 +108,7 @@ class ZGate(Gate):
 
     def __array__(self, dtype=None):
         """Return a numpy.array for the Z gate."""
-        return numpy.array([[1, 0], [0, -1]], dtype=dtype)
+        return numpy.array(self._matrix, dtype=dtype)
 
 
 class CZGate(ControlledGate):
@@ -137,6 +140,7 @@ class CZGate(ControlledGate):
     In the computational basis, this gate flips the phase of
     the target qubit if the control qubit is in the :math:`|1\rangle` state.
     """
+    _is_self_inverse = True
 
     def __init__(self, label=None, ctrl_state=None):
         """Create new CZ gate."""
@@ -1298,7 +1298,6 @@ class QuantumCircuit:
 
         gate_parameters = ",".join(["param%i" % num for num in range(len(instruction.params))])
         qubit_parameters = ",".join(["q%i" % num for num in range(instruction.num_qubits)])
-        composite_circuit_gates = ""
 
         definition = instruction.definition
         definition_bit_labels = {
@@ -1306,14 +1305,13 @@ class QuantumCircuit:
             for bits in (definition.qubits, definition.clbits)
             for idx, bit in enumerate(bits)
         }
-        for data, qargs, _ in definition:
-            gate_qargs = ",".join(
-                ["q%i" % index for index in [definition_bit_labels[qubit] for qubit in qargs]]
-            )
-            composite_circuit_gates += "%s %s; " % (data.qasm(), gate_qargs)
-
-        if composite_circuit_gates:
-            composite_circuit_gates = composite_circuit_gates.rstrip(" ")
+        composite_circuit_gates = " ".join(
+            [
+                "%s %s;"
+                % (data.qasm(), ",".join(["q%i" % definition_bit_labels[qubit] for qubit in qargs]))
+                for data, qargs, _ in definition
+            ]
+        )
 
         if gate_parameters:
             qasm_string = "gate %s(%s) %s { %s }" % (
@@ -1398,13 +1396,9 @@ class QuantumCircuit:
         ]
 
         existing_composite_circuits = []
+        composite_circuit_qasms = []
 
-        string_temp = self.header + "\n"
-        string_temp += self.extension_lib + "\n"
-        for register in self.qregs:
-            string_temp += register.qasm() + "\n"
-        for register in self.cregs:
-            string_temp += register.qasm() + "\n"
+        string_temp = [register.qasm() + "\n" for register in self.qregs + self.cregs]
 
         qreg_bits = set(bit for reg in self.qregs for bit in reg)
         creg_bits = set(bit for reg in self.cregs for bit in reg)
@@ -1413,11 +1407,11 @@ class QuantumCircuit:
 
         if set(self.qubits) != qreg_bits:
             regless_qubits = [bit for bit in self.qubits if bit not in qreg_bits]
-            string_temp += "qreg %s[%d];\n" % ("regless", len(regless_qubits))
+            string_temp.append("qreg %s[%d];\n" % ("regless", len(regless_qubits)))
 
         if set(self.clbits) != creg_bits:
             regless_clbits = [bit for bit in self.clbits if bit not in creg_bits]
-            string_temp += "creg %s[%d];\n" % ("regless", len(regless_clbits))
+            string_temp.append("creg %s[%d];\n" % ("regless", len(regless_clbits)))
 
         unitary_gates = []
 
@@ -1439,10 +1433,8 @@ class QuantumCircuit:
             if instruction.name == "measure":
                 qubit = qargs[0]
                 clbit = cargs[0]
-                string_temp += "%s %s -> %s;\n" % (
-                    instruction.qasm(),
-                    bit_labels[qubit],
-                    bit_labels[clbit],
+                string_temp.append(
+                    "%s %s -> %s;\n" % (instruction.qasm(), bit_labels[qubit], bit_labels[clbit])
                 )
 
             # If instruction is a root gate or a root instruction (in that case, compositive)
@@ -1467,25 +1459,22 @@ class QuantumCircuit:
                         )
 
                     # Get qasm of composite circuit
-                    qasm_string = self._get_composite_circuit_qasm_from_instruction(instruction)
-
-                    # Insert composite circuit qasm definition right after header and extension lib
-                    string_temp = string_temp.replace(
-                        self.extension_lib, "%s\n%s" % (self.extension_lib, qasm_string)
+                    composite_circuit_qasms.append(
+                        self._get_composite_circuit_qasm_from_instruction(instruction)
                     )
 
                     existing_composite_circuits.append(instruction)
                     existing_gate_names.append(instruction.name)
 
                 # Insert qasm representation of the original instruction
-                string_temp += "%s %s;\n" % (
-                    instruction.qasm(),
-                    ",".join([bit_labels[j] for j in qargs + cargs]),
+                string_temp.append(
+                    "%s %s;\n"
+                    % (instruction.qasm(), ",".join([bit_labels[j] for j in qargs + cargs]))
                 )
             else:
-                string_temp += "%s %s;\n" % (
-                    instruction.qasm(),
-                    ",".join([bit_labels[j] for j in qargs + cargs]),
+                string_temp.append(
+                    "%s %s;\n"
+                    % (instruction.qasm(), ",".join([bit_labels[j] for j in qargs + cargs]))
                 )
             if instruction.name == "unitary":
                 unitary_gates.append(instruction)
@@ -1494,6 +1483,14 @@ class QuantumCircuit:
         for gate in unitary_gates:
             gate._qasm_def_written = False
 
+        # Insert composite circuit qasm definitions right after header and extension lib,
+        # the most recently defined first
+        string_temp = "".join(
+            [self.header + "\n", self.extension_lib + "\n"]
+            + [qasm_string + "\n" for qasm_string in reversed(composite_circuit_qasms)]
+            + string_temp
+        )
+
         if filename:
             with open(filename, "w+") as file:
                 file.write(string_temp)
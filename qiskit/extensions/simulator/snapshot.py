@@ -23,6 +23,7 @@ class Snapshot(Instruction):
     """Simulator snapshot instruction."""
 
     _directive = True
+    _is_self_inverse = True
 
     def __init__(self, label, snapshot_type="statevector", num_qubits=0, num_clbits=0, params=None):
         """Create new snapshot instruction.
@@ -54,7 +55,13 @@ class Snapshot(Instruction):
 
     def inverse(self):
         """Special case. Return self."""
-        return Snapshot(self.num_qubits, self.num_clbits, self.params[0], self.params[1])
+        return Snapshot(
+            self.label,
+            snapshot_type=self.snapshot_type,
+            num_qubits=self.num_qubits,
+            num_clbits=self.num_clbits,
+            params=list(self.params),
+        )
 
     @property
     def snapshot_type(self):
@@ -108,19 +115,14 @@ def snapshot(self, label, snapshot_type="statevector", qubits=None, params=None)
     if isinstance(qubits, QuantumRegister):
         qubits = qubits[:]
     if not qubits:
-        tuples = []
-        if isinstance(self, QuantumCircuit):
-            for register in self.qregs:
-                tuples.append(register)
-        if not tuples:
+        qregs = self.qregs if isinstance(self, QuantumCircuit) else []
+        if not qregs:
             raise ExtensionError("no qubits for snapshot")
         qubits = []
-        for tuple_element in tuples:
-            if isinstance(tuple_element, QuantumRegister):
-                for j in range(tuple_element.size):
-                    qubits.append(tuple_element[j])
-            else:
-                qubits.append(tuple_element)
+        for register in qregs:
+            qubits.extend(register[:])
+        if len(set(qubits)) != len(qubits):
+            raise ExtensionError("duplicate qubits in snapshot registers")
     return self.append(
         Snapshot(label, snapshot_type=snapshot_type, num_qubits=len(qubits), params=params), qubits
     )
@@ -31,13 +31,6 @@ from ..operator_globals import Zero, One
 from ..state_fns.circuit_state_fn import CircuitStateFn
 from ..exceptions import OpflowError
 
-try:
-    from jax import grad, jit
-
-    _HAS_JAX = True
-except ImportError:
-    _HAS_JAX = False
-
 
 class Gradient(GradientBase):
     """Convert an operator expression to the first-order gradient."""
@@ -205,16 +198,19 @@ class Gradient(GradientBase):
             if operator.grad_combo_fn:
                 grad_combo_fn = operator.grad_combo_fn
             else:
-                if _HAS_JAX:
-                    grad_combo_fn = jit(grad(operator._combo_fn, holomorphic=True))
-                else:
+                # JAX is only imported when the combo_fn has to be differentiated, since
+                # importing it is expensive and it is not needed anywhere else.
+                try:
+                    from jax import grad, jit
+                except ImportError as ex:
                     raise MissingOptionalLibraryError(
                         libname="jax",
                         name="get_gradient",
                         msg="This automatic differentiation function is based on JAX. "
                         "Please install jax and use `import jax.numpy as jnp` instead "
                         "of `import numpy as np` when defining a combo_fn.",
-                    )
+                    ) from ex
+                grad_combo_fn = jit(grad(operator._combo_fn, holomorphic=True))
 
             def chain_rule_combo_fn(x):
                 result = np.dot(x[1], x[0])
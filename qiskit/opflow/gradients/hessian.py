@@ -34,13 +34,6 @@ from .hessian_base import HessianBase
 from ..exceptions import OpflowError
 from ...utils.arithmetic import triu_to_dense
 
-try:
-    from jax import grad, jit
-
-    _HAS_JAX = True
-except ImportError:
-    _HAS_JAX = False
-
 
 class Hessian(HessianBase):
     """Compute the Hessian of an expected value."""
@@ -243,34 +236,26 @@ class Hessian(HessianBase):
                 ]
             )
 
+            # JAX is only imported when the combo_fn has to be differentiated, since importing
+            # it is expensive and it is not needed anywhere else.
+            try:
+                from jax import grad, jit
+            except ImportError as ex:
+                raise MissingOptionalLibraryError(
+                    libname="jax",
+                    name="get_hessian",
+                    msg="This automatic differentiation function is based on JAX. "
+                    "Please install jax and use `import jax.numpy as jnp` instead "
+                    "of `import numpy as np` when defining a combo_fn.",
+                ) from ex
+
             if operator.grad_combo_fn:
                 first_partial_combo_fn = operator.grad_combo_fn
-                if _HAS_JAX:
-                    second_partial_combo_fn = jit(
-                        grad(lambda x: first_partial_combo_fn(x)[0], holomorphic=True)
-                    )
-                else:
-                    raise MissingOptionalLibraryError(
-                        libname="jax",
-                        name="get_hessian",
-                        msg="This automatic differentiation function is based on JAX. Please "
-                        "install jax and use `import jax.numpy as jnp` instead of "
-                        "`import numpy as np` when defining a combo_fn.",
-                    )
             else:
-                if _HAS_JAX:
-                    first_partial_combo_fn = jit(grad(operator.combo_fn, holomorphic=True))
-                    second_partial_combo_fn = jit(
-                        grad(lambda x: first_partial_combo_fn(x)[0], holomorphic=True)
-                    )
-                else:
-                    raise MissingOptionalLibraryError(
-                        libname="jax",
-                        name="get_hessian",
-                        msg="This automatic differentiation function is based on JAX. "
-                        "Please install jax and use `import jax.numpy as jnp` instead "
-                        "of `import numpy as np` when defining a combo_fn.",
-                    )
+                first_partial_combo_fn = jit(grad(operator.combo_fn, holomorphic=True))
+            second_partial_combo_fn = jit(
+                grad(lambda x: first_partial_combo_fn(x)[0], holomorphic=True)
+            )
 
             # For a general combo_fn F(g_0, g_1, ..., g_k)
             # dF/d θ0,θ1 = sum_i: (∂F/∂g_i)•(d g_i/ d θ0,θ1) + (∂F/∂^2 g_i)•(d g_i/d θ0)•(d g_i/d
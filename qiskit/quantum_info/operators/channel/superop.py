@@ -14,6 +14,9 @@
 Superoperator representation of a Quantum Channel."""
 
 import copy
+import functools
+from numbers import Integral
+from operator import mul
 import numpy as np
 
 from qiskit.circuit.quantumcircuit import QuantumCircuit
@@ -26,6 +29,18 @@ from qiskit.quantum_info.operators.channel.transformations import _to_superop
 from qiskit.quantum_info.operators.channel.transformations import _bipartite_tensor
 from qiskit.quantum_info.operators.mixins import generate_apidocs
 
+# Largest unitary matrix dimension for which the superoperator of an
+# instruction is cached.
+_UNITARY_CACHE_MAX_DIM = 4
+
+# Superoperator matrix of a single-qubit reset instruction.
+_RESET_SUPEROP = np.array([[1, 0, 0, 1], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]], dtype=complex)
+_RESET_SUPEROP.setflags(write=False)
+
+# Tensor size from which subsystem contractions use a tensordot matrix product
+# instead of einsum. Below it the einsum call has less overhead.
+_TENSORDOT_MIN_SIZE = 4096
+
 
 class SuperOp(QuantumChannel):
     r"""Superoperator representation of a quantum channel.
@@ -151,6 +166,17 @@ class SuperOp(QuantumChannel):
         ret._op_shape = self._op_shape.transpose()
         return ret
 
+    def power(self, n):
+        # Positive integer powers are computed by repeated squaring of the
+        # superoperator matrix rather than by n - 1 compositions.
+        if n > 0 and isinstance(n, Integral):
+            if self._input_dim != self._output_dim:
+                raise QiskitError("Can only take power with input_dim = output_dim.")
+            ret = copy.copy(self)
+            ret._data = np.linalg.matrix_power(self._data, n)
+            return ret
+        return super().power(n)
+
     def tensor(self, other):
         if not isinstance(other, SuperOp):
             other = SuperOp(other)
@@ -166,7 +192,7 @@ class SuperOp(QuantumChannel):
         ret = copy.copy(a)
         ret._op_shape = a._op_shape.tensor(b._op_shape)
         ret._data = _bipartite_tensor(
-            a._data, b.data, shape1=a._bipartite_shape, shape2=b._bipartite_shape
+            a._data, b._data, shape1=a._bipartite_shape, shape2=b._bipartite_shape
         )
         return ret
 
@@ -184,13 +210,24 @@ class SuperOp(QuantumChannel):
         # Full composition of superoperators
         if qargs is None:
             if front:
-                data = np.dot(self._data, other.data)
+                data = np.dot(self._data, other._data)
             else:
-                data = np.dot(other.data, self._data)
+                data = np.dot(other._data, self._data)
             ret = SuperOp(data, input_dims, output_dims)
             ret._op_shape = new_shape
             return ret
 
+        final_shape = [new_shape._dim_l ** 2, new_shape._dim_r ** 2]
+        data = np.reshape(self._compose_qargs(other, qargs, front), final_shape)
+        ret = SuperOp(data, input_dims, output_dims)
+        ret._op_shape = new_shape
+        return ret
+
+    def _compose_qargs(self, other, qargs, front=False):
+        """Return the tensor of the superoperator composed with other on qargs.
+
+        This performs no validation of the subsystem dimensions.
+        """
         # Compute tensor contraction indices from qargs
         num_qargs_l, num_qargs_r = self._op_shape.num_qargs
         if front:
@@ -206,19 +243,15 @@ class SuperOp(QuantumChannel):
         # Note that we must reverse the subsystem dimension order as
         # qubit 0 corresponds to the right-most position in the tensor
         # product, which is the last tensor wire index.
-        tensor = np.reshape(self.data, self._tensor_shape)
-        mat = np.reshape(other.data, other._tensor_shape)
+        tensor = np.reshape(self._data, self._tensor_shape)
+        mat = np.reshape(other._data, other._tensor_shape)
         # Add first set of indices
         indices = [2 * num_indices - 1 - qubit for qubit in qargs] + [
             num_indices - 1 - qubit for qubit in qargs
         ]
-        final_shape = [np.product(output_dims) ** 2, np.product(input_dims) ** 2]
-        data = np.reshape(
-            Operator._einsum_matmul(tensor, mat, indices, shift, right_mul), final_shape
-        )
-        ret = SuperOp(data, input_dims, output_dims)
-        ret._op_shape = new_shape
-        return ret
+        if tensor.size >= _TENSORDOT_MIN_SIZE:
+            return Operator._tensordot_matmul(tensor, mat, indices, shift, right_mul)
+        return Operator._einsum_matmul(tensor, mat, indices, shift, right_mul)
 
     # ---------------------------------------------------------------------
     # Additional methods
@@ -273,13 +306,16 @@ class SuperOp(QuantumChannel):
         indices = [num_indices - 1 - qubit for qubit in qargs] + [
             2 * num_indices - 1 - qubit for qubit in qargs
         ]
-        tensor = Operator._einsum_matmul(tensor, mat, indices)
+        if tensor.size >= _TENSORDOT_MIN_SIZE:
+            tensor = Operator._tensordot_matmul(tensor, mat, indices)
+        else:
+            tensor = Operator._einsum_matmul(tensor, mat, indices)
         # Replace evolved dimensions
         new_dims = list(state.dims())
         output_dims = self.output_dims()
         for i, qubit in enumerate(qargs):
             new_dims[qubit] = output_dims[i]
-        new_dim = np.product(new_dims)
+        new_dim = functools.reduce(mul, new_dims)
         # reshape tensor to density matrix
         tensor = np.reshape(tensor, (new_dim, new_dim))
         return DensityMatrix(tensor, dims=new_dims)
@@ -305,7 +341,7 @@ class SuperOp(QuantumChannel):
         if obj.name == "reset":
             # For superoperator evolution we can simulate a reset as
             # a non-unitary superoperator matrix
-            chan = SuperOp(np.array([[1, 0, 0, 1], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]))
+            chan = SuperOp(_RESET_SUPEROP)
         if obj.name == "kraus":
             kraus = obj.params
             dim = len(kraus[0])
@@ -314,9 +350,12 @@ class SuperOp(QuantumChannel):
             # If instruction is a gate first we see if it has a
             # `to_matrix` definition and if so use that.
             try:
-                kraus = [obj.to_matrix()]
-                dim = len(kraus[0])
-                chan = SuperOp(_to_superop("Kraus", (kraus, None), dim, dim))
+                mat = np.asarray(obj.to_matrix(), dtype=complex)
+                dim = len(mat)
+                if dim <= _UNITARY_CACHE_MAX_DIM:
+                    chan = SuperOp(_unitary_to_superop(mat.tobytes(), dim))
+                else:
+                    chan = SuperOp(_to_superop("Kraus", ([mat], None), dim, dim))
             except QiskitError:
                 pass
         return chan
@@ -324,15 +363,16 @@ class SuperOp(QuantumChannel):
     def _append_instruction(self, obj, qargs=None):
         """Update the current Operator by apply an instruction."""
         from qiskit.circuit.barrier import Barrier
+        from qiskit.circuit.delay import Delay
+        from qiskit.circuit.library.standard_gates import IGate
 
+        # Instructions which act as the identity channel
+        identities = (Barrier, Delay, IGate)
+        if isinstance(obj, identities):
+            return
         chan = self._instruction_to_superop(obj)
         if chan is not None:
-            # Perform the composition and inplace update the current state
-            # of the operator
-            op = self.compose(chan, qargs=qargs)
-            self._data = op.data
-        elif isinstance(obj, Barrier):
-            return
+            self._append_superop(chan, qargs)
         else:
             # If the instruction doesn't have a matrix defined we use its
             # circuit decomposition definition if it exists, otherwise we
@@ -345,17 +385,54 @@ class SuperOp(QuantumChannel):
                     "expected QuantumCircuit".format(obj.name, type(obj.definition))
                 )
             qubit_indices = {bit: idx for idx, bit in enumerate(obj.definition.qubits)}
+            # Consecutive instructions on the same qargs are multiplied together
+            # before they are composed into the full superoperator.
+            pending, pending_qargs = None, None
             for instr, qregs, cregs in obj.definition.data:
                 if cregs:
                     raise QiskitError(
                         "Cannot apply instruction with classical registers: {}".format(instr.name)
                     )
+                # Identity instructions do not interrupt a run of fused instructions
+                if isinstance(instr, identities):
+                    continue
                 # Get the integer position of the flat register
                 if qargs is None:
                     new_qargs = [qubit_indices[tup] for tup in qregs]
                 else:
                     new_qargs = [qargs[qubit_indices[tup]] for tup in qregs]
-                self._append_instruction(instr, qargs=new_qargs)
+                chan = self._instruction_to_superop(instr)
+                if chan is not None and new_qargs == pending_qargs:
+                    pending._data = np.dot(chan._data, pending._data)
+                    continue
+                if pending is not None:
+                    self._append_superop(pending, pending_qargs)
+                if chan is not None:
+                    pending, pending_qargs = chan, new_qargs
+                else:
+                    pending, pending_qargs = None, None
+                    self._append_instruction(instr, qargs=new_qargs)
+            if pending is not None:
+                self._append_superop(pending, pending_qargs)
+
+    def _append_superop(self, chan, qargs=None):
+        """Update the current SuperOp by composing with a SuperOp on qargs."""
+        # Instructions do not change the subsystem dimensions so the
+        # contraction is done directly on the data without constructing
+        # an intermediate SuperOp.
+        if qargs is None:
+            self._data = np.dot(chan._data, self._data)
+        else:
+            self._data = np.reshape(self._compose_qargs(chan, qargs), self._data.shape)
+
+
+@functools.lru_cache(maxsize=256)
+def _unitary_to_superop(data, dim):
+    """Return a read-only superoperator matrix for a unitary, cached on its bytes."""
+    mat = np.frombuffer(data, dtype=complex).reshape(dim, dim)
+    superop = np.kron(np.conj(mat), mat)
+    superop.setflags(write=False)
+    return superop
 
 
 # Update docstrings for API docs
@@ -366,8 +366,8 @@ def _bipartite_tensor(mat1, mat2, shape1=None, shape2=None):
         QiskitError: if input matrices are wrong shape.
     """
     # Convert inputs to numpy arrays
-    mat1 = np.array(mat1)
-    mat2 = np.array(mat2)
+    mat1 = np.asarray(mat1)
+    mat2 = np.asarray(mat2)
 
     # Determine bipartite dimensions if not provided
     dim_a0, dim_a1 = mat1.shape
@@ -391,17 +391,19 @@ def _bipartite_tensor(mat1, mat2, shape1=None, shape2=None):
 
 def _reravel(mat1, mat2, shape1, shape2):
     """Reravel two bipartite matrices."""
-    # Reshuffle indices
     left_dims = shape1[:2] + shape2[:2]
     right_dims = shape1[2:] + shape2[2:]
-    tensor_shape = left_dims + right_dims
     final_shape = (np.product(left_dims), np.product(right_dims))
-    # Tensor product matrices
-    data = np.kron(mat1, mat2)
-    data = np.reshape(
-        np.transpose(np.reshape(data, tensor_shape), (0, 2, 1, 3, 4, 6, 5, 7)), final_shape
+    # Tensor product matrices writing the reshuffled indices directly,
+    # rather than transposing the Kronecker product.
+    data = np.einsum(
+        np.reshape(mat1, shape1),
+        [0, 1, 2, 3],
+        np.reshape(mat2, shape2),
+        [4, 5, 6, 7],
+        [0, 4, 1, 5, 2, 6, 3, 7],
     )
-    return data
+    return np.reshape(data, final_shape)
 
 
 def _transform_to_pauli(data, num_qubits):
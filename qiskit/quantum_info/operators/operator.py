@@ -441,6 +441,42 @@ class Operator(LinearOp):
             indices_mat = mat_free + mat_contract
         return np.einsum(tensor, indices_tensor, mat, indices_mat)
 
+    @classmethod
+    def _tensordot_matmul(cls, tensor, mat, indices, shift=0, right_mul=False):
+        """Perform the same contraction as :meth:`_einsum_matmul` using Numpy.tensordot
+
+        This contracts the tensor with a single matrix product, which is
+        faster than einsum for large tensors.
+
+        Args:
+            tensor (np.array): a vector or matrix reshaped to a rank-N tensor.
+            mat (np.array): a matrix reshaped to a rank-2M tensor.
+            indices (list): tensor indices to contract with mat.
+            shift (int): shift for indices of tensor to contract [Default: 0].
+            right_mul (bool): if True right multiply tensor by mat
+                              (else left multiply) [Default: False].
+
+        Returns:
+            Numpy.ndarray: the matrix multiplied rank-N tensor.
+
+        Raises:
+            QiskitError: if mat is not an even rank tensor.
+        """
+        rank = tensor.ndim
+        num_indices = len(indices)
+        if mat.ndim % 2 != 0:
+            raise QiskitError("Contracted matrix must have an even number of indices.")
+        axes_tensor = [index + shift for index in indices]
+        # The free indices of mat are ordered in reverse to the contracted tensor indices
+        axes_free = axes_tensor[::-1]
+        if right_mul:
+            axes_mat = list(range(num_indices - 1, -1, -1))
+            tensor = np.tensordot(tensor, mat, axes=(axes_tensor, axes_mat))
+            return np.moveaxis(tensor, range(rank - num_indices, rank), axes_free)
+        axes_mat = list(range(2 * num_indices - 1, num_indices - 1, -1))
+        tensor = np.tensordot(mat, tensor, axes=(axes_mat, axes_tensor))
+        return np.moveaxis(tensor, range(num_indices), axes_free)
+
     @classmethod
     def _init_instruction(cls, instruction):
         """Convert a QuantumCircuit or Instruction to an Operator."""
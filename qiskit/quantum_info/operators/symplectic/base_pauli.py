@@ -23,6 +23,9 @@ from qiskit.circuit.barrier import Barrier
 from qiskit.quantum_info.operators.base_operator import BaseOperator
 from qiskit.quantum_info.operators.mixins import AdjointMixin, MultiplyMixin
 
+# ASCII codes of the Pauli label characters indexed by x + 2 * z
+_PAULI_LABEL_CODES = np.frombuffer(b"IXZY", dtype=np.uint8)
+
 
 class BasePauli(BaseOperator, AdjointMixin, MultiplyMixin):
     r"""Symplectic representation of a list of N-qubit Paulis.
@@ -72,7 +75,7 @@ class BasePauli(BaseOperator, AdjointMixin, MultiplyMixin):
     def _tensor(cls, a, b):
         z = np.hstack([a._stack(b._z, a._num_paulis), a._z])
         x = np.hstack([a._stack(b._x, a._num_paulis), a._x])
-        phase = np.mod(a._phase + b._phase, 4)
+        phase = (a._phase + b._phase) & 3
         return BasePauli(z, x, phase)
 
     # pylint: disable=arguments-differ
@@ -142,7 +145,7 @@ class BasePauli(BaseOperator, AdjointMixin, MultiplyMixin):
         ret = self if inplace else self.copy()
         ret._x[:, qargs] = x
         ret._z[:, qargs] = z
-        ret._phase = np.mod(phase, 4)
+        ret._phase = phase & 3
         return ret
 
     def _multiply(self, other):
@@ -160,25 +163,25 @@ class BasePauli(BaseOperator, AdjointMixin, MultiplyMixin):
             cls=type(self).__name__
         )
         if isinstance(other, (np.ndarray, list, tuple)):
-            phase = np.array([self._phase_from_complex(phase) for phase in other])
+            phase = np.array([self._phase_from_complex(phase) for phase in other], dtype=int)
         else:
             phase = self._phase_from_complex(other)
-        return BasePauli(self._z, self._x, np.mod(self._phase + phase, 4))
+        return BasePauli(self._z, self._x, (self._phase + phase) & 3)
 
     def conjugate(self):
         """Return the conjugate of each Pauli in the list."""
-        complex_phase = np.mod(self._phase, 2)
+        complex_phase = self._phase & 1
         if np.all(complex_phase == 0):
             return self
-        return BasePauli(self._z, self._x, np.mod(self._phase + 2 * complex_phase, 4))
+        return BasePauli(self._z, self._x, (self._phase + 2 * complex_phase) & 3)
 
     def transpose(self):
         """Return the transpose of each Pauli in the list."""
         # Transpose sets Y -> -Y. This has effect on changing the phase
-        parity_y = self._count_y() % 2
+        parity_y = self._count_y() & 1
         if np.all(parity_y == 0):
             return self
-        return BasePauli(self._z, self._x, np.mod(self._phase + 2 * parity_y, 4))
+        return BasePauli(self._z, self._x, (self._phase + 2 * parity_y) & 3)
 
     def commutes(self, other, qargs=None):
         """Return True if Pauli that commutes with other.
@@ -260,7 +263,7 @@ class BasePauli(BaseOperator, AdjointMixin, MultiplyMixin):
 
     def __neg__(self):
         ret = copy.copy(self)
-        ret._phase = np.mod(self._phase + 2, 4)
+        ret._phase = (self._phase + 2) & 3
         return ret
 
     def _count_y(self):
@@ -272,7 +275,7 @@ class BasePauli(BaseOperator, AdjointMixin, MultiplyMixin):
         """Stack array."""
         if size == 1:
             return array
-        return np.vstack(size * [array])
+        return np.broadcast_to(array, (size, array.shape[1]))
 
     @staticmethod
     def _phase_from_complex(coeff):
@@ -312,7 +315,9 @@ class BasePauli(BaseOperator, AdjointMixin, MultiplyMixin):
             raise QiskitError("z and x vectors are different size.")
 
         # Convert group phase convention to internal ZX-phase conversion.
-        base_phase = np.mod(np.sum(np.logical_and(base_x, base_z), axis=1, dtype=int) + phase, 4)
+        base_phase = np.mod(
+            np.sum(np.logical_and(base_x, base_z), axis=1, dtype=int) + phase, 4
+        ).astype(int)
         return base_z, base_x, base_phase
 
     @staticmethod
@@ -395,21 +400,14 @@ class BasePauli(BaseOperator, AdjointMixin, MultiplyMixin):
                             the phase ``q`` for the coefficient :math:`(-i)^(q + x.z)`
                             for the label from the full Pauli group.
         """
-        num_qubits = z.size
+        z = np.asarray(z, dtype=bool)
+        x = np.asarray(x, dtype=bool)
         coeff_labels = {0: "", 1: "-i", 2: "-", 3: "i"}
-        label = ""
-        for i in range(num_qubits):
-            if not z[num_qubits - 1 - i]:
-                if not x[num_qubits - 1 - i]:
-                    label += "I"
-                else:
-                    label += "X"
-            elif not x[num_qubits - 1 - i]:
-                label += "Z"
-            else:
-                label += "Y"
-                if not group_phase:
-                    phase -= 1
+        # Index the label character of each qubit as I=0, X=1, Z=2, Y=3 and
+        # reverse so qubit-0 is the right-most character
+        label = _PAULI_LABEL_CODES[x + 2 * z.astype(np.uint8)][::-1].tobytes().decode("ascii")
+        if not group_phase:
+            phase -= np.count_nonzero(x & z)
         phase %= 4
         if phase and full_group:
             label = coeff_labels[phase] + label
@@ -509,7 +507,7 @@ class BasePauli(BaseOperator, AdjointMixin, MultiplyMixin):
 
         # Since the individual gate evolution functions don't take mod
         # of phase we update it at the end
-        self._phase %= 4
+        self._phase &= 3
         return self
 
 
@@ -12,6 +12,8 @@
 """
 Clifford operator class.
 """
+import functools
+import itertools
 import re
 import numpy as np
 
@@ -118,7 +120,7 @@ class Clifford(BaseOperator, AdjointMixin):
         elif isinstance(data, ScalarOp):
             if not data.num_qubits or not data.is_unitary():
                 raise QiskitError("Can only initialize from N-qubit identity ScalarOp.")
-            self._table = StabilizerTable(np.eye(2 * data.num_qubits, dtype=bool))
+            self._table = Clifford._identity(data.num_qubits)._table
 
         # Initialize from a QuantumCircuit or Instruction object
         elif isinstance(data, (QuantumCircuit, Instruction)):
@@ -265,13 +267,33 @@ class Clifford(BaseOperator, AdjointMixin):
         other = self._pad_with_identity(other, qargs)
 
         if front:
-            table1 = self.table
-            table2 = other.table
+            first, second = self, other
         else:
-            table1 = other.table
-            table2 = self.table
+            first, second = other, self
 
-        num_qubits = self.num_qubits
+        if self.num_qubits == 1:
+            return self._compose_1q(first, second)
+        return self._compose_general(first, second)
+
+    @classmethod
+    def _compose_1q(cls, first, second):
+        """Return the composition of two single-qubit Cliffords from a lookup table."""
+        index, table, arrays, phases = _compose_1q_table()
+        ind1 = index.get(_clifford_1q_key(first))
+        ind2 = index.get(_clifford_1q_key(second))
+        if ind1 is None or ind2 is None:
+            # Tables which are not valid Cliffords are not in the lookup table
+            return cls._compose_general(first, second)
+        ind = table[ind1, ind2]
+        return Clifford(StabilizerTable(arrays[ind].copy(), phases[ind].copy()), validate=False)
+
+    @classmethod
+    def _compose_general(cls, first, second):
+        """Return the composition of two N-qubit Cliffords."""
+        table1 = first.table
+        table2 = second.table
+
+        num_qubits = first.num_qubits
 
         array1 = table1.array.astype(int)
         phase1 = table1.phase.astype(int)
@@ -286,36 +308,29 @@ class Clifford(BaseOperator, AdjointMixin):
         phase = np.mod(array2.dot(phase1) + phase2, 2)
 
         # Correcting for phase due to Pauli multiplication
-        ifacts = np.zeros(2 * num_qubits, dtype=int)
-
-        for k in range(2 * num_qubits):
-
-            row2 = array2[k]
-            x2 = table2.X[k]
-            z2 = table2.Z[k]
-
-            # Adding a factor of i for each Y in the image of an operator under the
-            # first operation, since Y=iXZ
-
-            ifacts[k] += np.sum(x2 & z2)
-
-            # Adding factors of i due to qubit-wise Pauli multiplication
-
-            for j in range(num_qubits):
-                x = 0
-                z = 0
-                for i in range(2 * num_qubits):
-                    if row2[i]:
-                        x1 = array1[i, j]
-                        z1 = array1[i, j + num_qubits]
-                        if (x | z) & (x1 | z1):
-                            val = np.mod(np.abs(3 * z1 - x1) - np.abs(3 * z - x) - 1, 3)
-                            if val == 0:
-                                ifacts[k] += 1
-                            elif val == 1:
-                                ifacts[k] -= 1
-                        x = np.mod(x + x1, 2)
-                        z = np.mod(z + z1, 2)
+        # Adding a factor of i for each Y in the image of an operator under the
+        # first operation, since Y=iXZ
+        ifacts = np.sum(table2.X & table2.Z, axis=1, dtype=int)
+
+        # Adding factors of i due to qubit-wise Pauli multiplication
+        kernel = _compose_phase_kernel()
+        if kernel is not None:
+            kernel(array1, array2, ifacts)
+        else:
+            x1s = array1[:, :num_qubits]
+            z1s = array1[:, num_qubits:]
+            for k in range(2 * num_qubits):
+                rows = array2[k].nonzero()[0]
+                if rows.size < 2:
+                    continue
+                x1 = x1s[rows]
+                z1 = z1s[rows]
+                # Accumulated product of the previous rows for each qubit
+                x = np.cumsum(x1, axis=0) - x1
+                z = np.cumsum(z1, axis=0) - z1
+                x %= 2
+                z %= 2
+                ifacts[k] += np.sum(_PAULI_PRODUCT_IFACTS[8 * x + 4 * z + 2 * x1 + z1])
 
         p = np.mod(ifacts, 4) // 2
 
@@ -337,9 +352,8 @@ class Clifford(BaseOperator, AdjointMixin):
     @staticmethod
     def from_dict(obj):
         """Load a Clifford from a dictionary"""
-        destabilizer = StabilizerTable.from_labels(obj.get("destabilizer"))
-        stabilizer = StabilizerTable.from_labels(obj.get("stabilizer"))
-        return Clifford(destabilizer + stabilizer)
+        labels = list(obj.get("destabilizer")) + list(obj.get("stabilizer"))
+        return Clifford(StabilizerTable.from_labels(labels))
 
     def to_matrix(self):
         """Convert operator to Numpy matrix."""
@@ -397,7 +411,7 @@ class Clifford(BaseOperator, AdjointMixin):
             circuit = circuit.to_instruction()
 
         # Initialize an identity Clifford
-        clifford = Clifford(np.eye(2 * circuit.num_qubits), validate=False)
+        clifford = Clifford._identity(circuit.num_qubits)
         _append_circuit(clifford, circuit)
         return clifford
 
@@ -452,7 +466,7 @@ class Clifford(BaseOperator, AdjointMixin):
             raise QiskitError("Label contains invalid characters.")
         # Initialize an identity matrix and apply each gate
         num_qubits = len(label)
-        op = Clifford(np.eye(2 * num_qubits, dtype=bool))
+        op = Clifford._identity(num_qubits)
         for qubit, char in enumerate(reversed(label)):
             _append_circuit(op, label_gates[char], qargs=[qubit])
         return op
@@ -461,6 +475,11 @@ class Clifford(BaseOperator, AdjointMixin):
     # Internal helper functions
     # ---------------------------------------------------------------------
 
+    @staticmethod
+    def _identity(num_qubits):
+        """Return the N-qubit identity Clifford."""
+        return Clifford(StabilizerTable(np.eye(2 * num_qubits, dtype=bool)), validate=False)
+
     @staticmethod
     def _is_symplectic(mat):
         """Return True if input is symplectic matrix."""
@@ -472,11 +491,18 @@ class Clifford(BaseOperator, AdjointMixin):
         if mat.shape != (2 * dim, 2 * dim):
             return False
 
-        one = np.eye(dim, dtype=int)
-        zero = np.zeros((dim, dim), dtype=int)
-        seye = np.block([[zero, one], [one, zero]])
-        arr = mat.astype(int)
-        return np.array_equal(np.mod(arr.T.dot(seye).dot(arr), 2), seye)
+        # Left multiplying by [[0, 1], [1, 0]] swaps the two row blocks of the
+        # table, and the product is symmetric so we only need to check the
+        # upper blocks are [0, 1] and the lower right block is 0.
+        # The product is computed with uint8 since overflow wraps modulo 256
+        # and so preserves the parity of each entry.
+        arr = mat.astype(np.uint8)
+        prod = arr.T.dot(np.roll(arr, dim, axis=0)) & 1
+        return (
+            not prod[:dim, :dim].any()
+            and not prod[dim:, dim:].any()
+            and np.array_equal(prod[:dim, dim:], np.eye(dim))
+        )
 
     @staticmethod
     def _conjugate_transpose(clifford, method):
@@ -502,7 +528,7 @@ class Clifford(BaseOperator, AdjointMixin):
             ret.table.phase ^= clifford.dot(ret).table.phase
         if method in ["C", "T"]:
             # Apply conjugate
-            ret.table.phase ^= np.mod(np.sum(ret.table.X & ret.table.Z, axis=1), 2).astype(bool)
+            ret.table.phase ^= np.logical_xor.reduce(ret.table.X & ret.table.Z, axis=1)
         return ret
 
     def _pad_with_identity(self, clifford, qargs):
@@ -510,15 +536,12 @@ class Clifford(BaseOperator, AdjointMixin):
         if qargs is None:
             return clifford
 
-        padded = Clifford(StabilizerTable(np.eye(2 * self.num_qubits, dtype=bool)), validate=False)
+        padded = Clifford._identity(self.num_qubits)
 
         inds = list(qargs) + [self.num_qubits + i for i in qargs]
 
         # Pad Pauli array
-        pauli = clifford.table.array
-        for i, pos in enumerate(qargs):
-            padded.table.array[inds, pos] = pauli[:, i]
-            padded.table.array[inds, self.num_qubits + pos] = pauli[:, clifford.num_qubits + i]
+        padded.table.array[np.ix_(inds, inds)] = clifford.table.array
 
         # Pad phase
         padded.table.phase[inds] = clifford.table.phase
@@ -526,5 +549,73 @@ class Clifford(BaseOperator, AdjointMixin):
         return padded
 
 
+def _clifford_1q_key(clifford):
+    """Return the bytes key of a single-qubit Clifford table."""
+    return clifford.table._array.tobytes() + clifford.table._phase.tobytes()
+
+
+@functools.lru_cache(maxsize=None)
+def _compose_1q_table():
+    """Return the lookup tables for composing single-qubit Cliffords.
+
+    Returns:
+        tuple: ``(index, table, arrays, phases)`` where ``index`` maps the key
+        of each of the 24 single-qubit Cliffords to its position, ``table[i, j]``
+        is the position of the composition of Clifford ``i`` followed by
+        Clifford ``j``, and ``arrays`` and ``phases`` hold the stabilizer
+        table of the Clifford at each position.
+    """
+    arrays = []
+    phases = []
+    for bits in itertools.product([False, True], repeat=6):
+        array = np.array(bits[:4]).reshape(2, 2)
+        if Clifford._is_symplectic(array):
+            arrays.append(array)
+            phases.append(np.array(bits[4:]))
+    cliffords = [
+        Clifford(StabilizerTable(array, phase), validate=False)
+        for array, phase in zip(arrays, phases)
+    ]
+    index = {_clifford_1q_key(cliff): i for i, cliff in enumerate(cliffords)}
+    table = np.zeros((len(cliffords), len(cliffords)), dtype=np.uint8)
+    for i, cliff1 in enumerate(cliffords):
+        for j, cliff2 in enumerate(cliffords):
+            table[i, j] = index[_clifford_1q_key(Clifford._compose_general(cliff1, cliff2))]
+    table.setflags(write=False)
+    return index, table, np.array(arrays), np.array(phases)
+
+
+# The power of i picked up by the product P.P1 of single-qubit Paulis
+# P = (x, z) and P1 = (x1, z1), indexed by 8 * x + 4 * z + 2 * x1 + z1.
+# For example X.Y = iZ gives +1 and Y.X = -iZ gives -1.
+_PAULI_PRODUCT_IFACTS = np.array([0, 0, 0, 0, 0, 0, 1, -1, 0, -1, 0, 1, 0, 1, -1, 0], dtype=int)
+
+
+def _compose_phase_loop(array1, array2, ifacts):
+    """Add the factors of i from the qubit-wise Pauli products in compose to ifacts."""
+    num_qubits = array1.shape[1] // 2
+    for k in range(array2.shape[0]):
+        for j in range(num_qubits):
+            x = 0
+            z = 0
+            for i in range(array2.shape[1]):
+                if array2[k, i]:
+                    x1 = array1[i, j]
+                    z1 = array1[i, j + num_qubits]
+                    ifacts[k] += _PAULI_PRODUCT_IFACTS[8 * x + 4 * z + 2 * x1 + z1]
+                    x ^= x1
+                    z ^= z1
+
+
+@functools.lru_cache(maxsize=None)
+def _compose_phase_kernel():
+    """Return a numba compiled compose phase kernel, or None if numba is not installed."""
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba.njit(cache=True)(_compose_phase_loop)
+
+
 # Update docstrings for API docs
 generate_apidocs(Clifford)
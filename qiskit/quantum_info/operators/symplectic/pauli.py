@@ -229,9 +229,9 @@ class Pauli(BasePauli):
             return False
         return (
             len(self) == len(other)
-            and np.all(np.mod(self._phase, 4) == np.mod(other._phase, 4))
-            and np.all(self._z == other._z)
-            and np.all(self._x == other._x)
+            and np.all((self._phase & 3) == (other._phase & 3))
+            and np.array_equal(self._z, other._z)
+            and np.array_equal(self._x, other._x)
         )
 
     def equiv(self, other):
@@ -248,7 +248,7 @@ class Pauli(BasePauli):
                 other = Pauli(other)
             except QiskitError:
                 return False
-        return np.all(self._z == other._z) and np.all(self._x == other._x)
+        return np.array_equal(self._z, other._z) and np.array_equal(self._x, other._x)
 
     # ---------------------------------------------------------------------
     # Direct array access
@@ -257,12 +257,12 @@ class Pauli(BasePauli):
     def phase(self):
         """Return the group phase exponent for the Pauli."""
         # Convert internal ZX-phase convention of BasePauli to group phase
-        return np.mod(self._phase - self._count_y(), 4)[0]
+        return ((self._phase - self._count_y()) & 3)[0]
 
     @phase.setter
     def phase(self, value):
         # Convert group phase convention to internal ZX-phase convention
-        self._phase[:] = np.mod(value + self._count_y(), 4)
+        self._phase[:] = np.mod(value + self._count_y(), 4).astype(int)
 
     @property
     def x(self):
@@ -305,6 +305,7 @@ class Pauli(BasePauli):
         self._x[0, qubits] = value.x
         # Add extra phase from new Pauli to current
         self._phase += value._phase
+        self._phase &= 3
 
     def delete(self, qubits):
         """Return a Pauli with qubits deleted.
@@ -587,9 +588,7 @@ class Pauli(BasePauli):
             QiskitError: if Pauli string is not valid.
         """
         # Split string into coefficient and Pauli
-        span = re.search(r"[IXYZ]+", label).span()
         pauli, coeff = _split_pauli_label(label)
-        coeff = label[: span[0]]
 
         # Convert coefficient to phase
         phase = 0 if not coeff else _phase_from_label(coeff)
@@ -597,19 +596,12 @@ class Pauli(BasePauli):
             raise QiskitError("Pauli string is not valid.")
 
         # Convert to Symplectic representation
-        num_qubits = len(pauli)
-        base_z = np.zeros((1, num_qubits), dtype=bool)
-        base_x = np.zeros((1, num_qubits), dtype=bool)
-        base_phase = np.array([phase], dtype=int)
-        for i, char in enumerate(pauli):
-            if char == "X":
-                base_x[0, num_qubits - 1 - i] = True
-            elif char == "Z":
-                base_z[0, num_qubits - 1 - i] = True
-            elif char == "Y":
-                base_x[0, num_qubits - 1 - i] = True
-                base_z[0, num_qubits - 1 - i] = True
-                base_phase += 1
+        # Label characters in qubit order
+        chars = np.frombuffer(pauli.encode("ascii"), dtype=np.uint8)[::-1]
+        is_y = chars == ord("Y")
+        base_z = (is_y | (chars == ord("Z"))).reshape((1, chars.size))
+        base_x = (is_y | (chars == ord("X"))).reshape((1, chars.size))
+        base_phase = np.array([phase + np.count_nonzero(is_y)], dtype=int)
         return base_z, base_x, base_phase % 4
 
     @classmethod
@@ -621,7 +613,7 @@ class Pauli(BasePauli):
         base_x = np.zeros((1, op.num_qubits), dtype=bool)
         base_phase = np.mod(
             cls._phase_from_complex(op.coeff) + np.sum(np.logical_and(base_z, base_x), axis=1), 4
-        )
+        ).astype(int)
         return base_z, base_x, base_phase
 
     @classmethod
@@ -1030,13 +1022,19 @@ class Pauli(BasePauli):
 # ---------------------------------------------------------------------
 
 
+_PAULI_LABEL_RE = re.compile(r"[IXYZ]+")
+
+# Map of normalized coefficient labels to internal phase
+_PHASE_LABELS = {"": 0, "-i": 1, "-": 2, "i": 3}
+
+
 def _split_pauli_label(label):
     """Split Pauli label into unsigned group label and coefficient label"""
-    span = re.search(r"[IXYZ]+", label).span()
+    span = _PAULI_LABEL_RE.search(label).span()
     pauli = label[span[0] :]
     coeff = label[: span[0]]
     if span[1] != len(label):
-        invalid = set(re.sub(r"[IXYZ]+", "", label[span[0] :]))
+        invalid = set(_PAULI_LABEL_RE.sub("", label[span[0] :]))
         raise QiskitError(
             "Pauli string contains invalid characters " "{} ∉ ['I', 'X', 'Y', 'Z']".format(invalid)
         )
@@ -1047,10 +1045,10 @@ def _phase_from_label(label):
     """Return the phase from a label"""
     # Returns None if label is invalid
     label = label.replace("+", "", 1).replace("1", "", 1).replace("j", "i", 1)
-    phases = {"": 0, "-i": 1, "-": 2, "i": 3}
-    if label not in phases:
+    phase = _PHASE_LABELS.get(label)
+    if phase is None:
         raise QiskitError("Invalid Pauli phase label '{}'".format(label))
-    return phases.get(label)
+    return phase
 
 
 # Update docstrings for API docs
@@ -19,11 +19,16 @@ import numpy as np
 from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators.base_operator import BaseOperator
 from qiskit.quantum_info.operators.scalar_op import ScalarOp
+from qiskit.quantum_info.operators.symplectic.base_pauli import _PAULI_LABEL_CODES
 from qiskit.quantum_info.operators.symplectic.pauli import Pauli
 from qiskit.quantum_info.operators.custom_iterator import CustomIterator
 from qiskit.quantum_info.operators.mixins import generate_apidocs, AdjointMixin
 
 
+# Valid Pauli label characters
+_PAULI_LABEL_CHARS = frozenset("IXYZ")
+
+
 class PauliTable(BaseOperator, AdjointMixin):
     r"""Symplectic representation of a list Pauli matrices.
 
@@ -178,7 +183,7 @@ class PauliTable(BaseOperator, AdjointMixin):
     def __eq__(self, other):
         """Test if two Pauli tables are equal."""
         if isinstance(other, PauliTable):
-            return np.all(self._array == other._array)
+            return np.array_equal(self._array, other._array)
         return False
 
     # ---------------------------------------------------------------------
@@ -242,7 +247,9 @@ class PauliTable(BaseOperator, AdjointMixin):
         # Returns a view of specified rows of the PauliTable
         # This supports all slicing operations the underlying array supports.
         if isinstance(key, (int, np.integer)):
-            key = [key]
+            # Index with a new axis so a single row is also returned as a
+            # view rather than a fancy-indexed copy
+            return PauliTable(self._array[np.newaxis, key])
         return PauliTable(self._array[key])
 
     def __setitem__(self, key, value):
@@ -280,7 +287,9 @@ class PauliTable(BaseOperator, AdjointMixin):
                     "Indices {} are not all less than the size"
                     " of the PauliTable ({})".format(ind, self.size)
                 )
-            return PauliTable(np.delete(self._array, ind, axis=0))
+            keep = np.ones(self.size, dtype=bool)
+            keep[ind] = False
+            return PauliTable(self._array[keep])
 
         # Column (qubit) deletion
         if max(ind) >= self.num_qubits:
@@ -288,8 +297,10 @@ class PauliTable(BaseOperator, AdjointMixin):
                 "Indices {} are not all less than the number of"
                 " qubits in the PauliTable ({})".format(ind, self.num_qubits)
             )
-        cols = ind + [self.num_qubits + i for i in ind]
-        return PauliTable(np.delete(self._array, cols, axis=1))
+        # Delete the qubit from both the X and Z blocks with a single mask
+        keep = np.ones(self.num_qubits, dtype=bool)
+        keep[ind] = False
+        return PauliTable(self._array[:, np.concatenate([keep, keep])])
 
     def insert(self, ind, value, qubit=False):
         """Insert Pauli's into the table.
@@ -322,7 +333,9 @@ class PauliTable(BaseOperator, AdjointMixin):
                     "Index {} is larger than the number of rows in the"
                     " PauliTable ({}).".format(ind, self.num_qubits)
                 )
-            return PauliTable(np.insert(self.array, ind, value.array, axis=0))
+            return PauliTable(
+                np.concatenate((self._array[:ind], value.array, self._array[ind:]), axis=0)
+            )
 
         # Column insertion
         if ind > self.num_qubits:
@@ -331,9 +344,9 @@ class PauliTable(BaseOperator, AdjointMixin):
                 " in the PauliTable ({})".format(ind, self.num_qubits)
             )
         if value.size == 1:
-            # Pad blocks to correct size
-            value_x = np.vstack(self.size * [value.X])
-            value_z = np.vstack(self.size * [value.Z])
+            # Broadcast blocks to correct size
+            value_x = np.broadcast_to(value.X, (self.size, value.num_qubits))
+            value_z = np.broadcast_to(value.Z, (self.size, value.num_qubits))
         elif value.size == self.size:
             #  Blocks are already correct size
             value_x = value.X
@@ -375,30 +388,20 @@ class PauliTable(BaseOperator, AdjointMixin):
         """
         # Get order of each Pauli using
         # I => 0, X => 1, Y => 2, Z => 3
-        x = self.X
-        z = self.Z
-        order = 1 * (x & ~z) + 2 * (x & z) + 3 * (~x & z)
-        # Optionally get the weight of Pauli
-        # This is the number of non identity terms
-        if weight:
-            weights = np.sum(x | z, axis=1)
-
-        # Sort by order
-        # To preserve ordering between successive sorts we
-        # are use the 'stable' sort method
-        indices = np.arange(self.size)
-        for i in range(self.num_qubits):
-            sort_inds = order[:, i].argsort(kind="stable")
-            order = order[sort_inds]
-            indices = indices[sort_inds]
-            if weight:
-                weights = weights[sort_inds]
-
-        # If using weights we implement a final sort by total number
-        # of non-identity Paulis
+        x = self.X.view(np.uint8)
+        z = self.Z.view(np.uint8)
+        order = (z << 1) | (x ^ z)
+        # Sort lexicographically with the last qubit as the most
+        # significant key. np.lexsort treats its final key as the primary
+        # one, so the qubit columns are passed in order.
+        keys = list(order.T)
+        # Optionally sort by weight first, where the weight is the number
+        # of non identity terms in the Pauli
         if weight:
-            indices = indices[weights.argsort(kind="stable")]
-        return indices
+            keys.append(np.sum(x | z, axis=1))
+        if not keys:
+            return np.arange(self.size)
+        return np.lexsort(keys)
 
     def sort(self, weight=False):
         """Sort the rows of the table.
@@ -476,10 +479,11 @@ class PauliTable(BaseOperator, AdjointMixin):
                 The number of times each of the unique values comes up in the
                 original array. Only provided if ``return_counts`` is True.
         """
+        keys = _row_keys(self._array)
         if return_counts:
-            _, index, counts = np.unique(self.array, return_index=True, return_counts=True, axis=0)
+            _, index, counts = np.unique(keys, return_index=True, return_counts=True)
         else:
-            _, index = np.unique(self.array, return_index=True, axis=0)
+            _, index = np.unique(keys, return_index=True)
         # Sort the index so we return unique rows in the original array order
         sort_inds = index.argsort()
         index = index[sort_inds]
@@ -837,13 +841,13 @@ class PauliTable(BaseOperator, AdjointMixin):
         n_paulis = len(labels)
         if n_paulis == 0:
             raise QiskitError("Input Pauli list is empty.")
-        # Get size from first Pauli
-        first = cls._from_label(labels[0])
-        array = np.zeros((n_paulis, len(first)), dtype=bool)
-        array[0] = first
-        for i in range(1, n_paulis):
-            array[i] = cls._from_label(labels[i])
-        return cls(array)
+        # Convert each distinct label once and stack the rows in a
+        # single call
+        symps = {}
+        for label in labels:
+            if label not in symps:
+                symps[label] = cls._from_label(label)
+        return cls(np.vstack([symps[label] for label in labels]))
 
     def to_labels(self, array=False):
         r"""Convert a PauliTable to a list Pauli string labels.
@@ -878,9 +882,7 @@ class PauliTable(BaseOperator, AdjointMixin):
         Returns:
             list or array: The rows of the PauliTable in label form.
         """
-        ret = np.zeros(self.size, dtype="<U{}".format(self.num_qubits))
-        for i in range(self.size):
-            ret[i] = self._to_label(self._array[i])
+        ret = _labels_from_codes(_label_codes(self.X, self.Z))
         if array:
             return ret
         return ret.tolist()
@@ -928,11 +930,7 @@ class PauliTable(BaseOperator, AdjointMixin):
         # For efficiency we also allow returning a single rank-3
         # array where first index is the Pauli row, and second two
         # indices are the matrix indices
-        dim = 2 ** self.num_qubits
-        ret = np.zeros((self.size, dim, dim), dtype=complex)
-        for i in range(self.size):
-            ret[i] = self._to_matrix(self._array[i])
-        return ret
+        return self._to_matrix_array(self._array)
 
     @staticmethod
     def _from_label(label):
@@ -941,21 +939,16 @@ class PauliTable(BaseOperator, AdjointMixin):
             # We allow +1 phase sign so we can convert back from positive
             # stabilizer strings
             label = label[1:]
-        num_qubits = len(label)
-        symp = np.zeros(2 * num_qubits, dtype=bool)
-        xs = symp[0:num_qubits]
-        zs = symp[num_qubits : 2 * num_qubits]
-        for i, char in enumerate(label):
-            if char not in ["I", "X", "Y", "Z"]:
-                raise QiskitError(
-                    "Pauli string contains invalid character:"
-                    " {} not in ['I', 'X', 'Y', 'Z'].".format(char)
-                )
-            if char in ["X", "Y"]:
-                xs[num_qubits - 1 - i] = True
-            if char in ["Z", "Y"]:
-                zs[num_qubits - 1 - i] = True
-        return symp
+        if not _PAULI_LABEL_CHARS.issuperset(label):
+            char = next(char for char in label if char not in _PAULI_LABEL_CHARS)
+            raise QiskitError(
+                "Pauli string contains invalid character:"
+                " {} not in ['I', 'X', 'Y', 'Z'].".format(char)
+            )
+        # Label characters in qubit order
+        chars = np.frombuffer(label.encode("ascii"), dtype=np.uint8)[::-1]
+        is_y = chars == ord("Y")
+        return np.concatenate([is_y | (chars == ord("X")), is_y | (chars == ord("Z"))])
 
     @staticmethod
     def _to_label(pauli):
@@ -967,18 +960,9 @@ class PauliTable(BaseOperator, AdjointMixin):
         num_qubits = symp.size // 2
         x = symp[0:num_qubits]
         z = symp[num_qubits : 2 * num_qubits]
-        paulis = np.zeros(num_qubits, dtype="<U1")
-        for i in range(num_qubits):
-            if not z[i]:
-                if not x[i]:
-                    paulis[num_qubits - 1 - i] = "I"
-                else:
-                    paulis[num_qubits - 1 - i] = "X"
-            elif not x[i]:
-                paulis[num_qubits - 1 - i] = "Z"
-            else:
-                paulis[num_qubits - 1 - i] = "Y"
-        return "".join(paulis)
+        # Index the label character of each qubit as I=0, X=1, Z=2, Y=3
+        codes = _PAULI_LABEL_CODES[x + 2 * z.astype(np.uint8)]
+        return codes[::-1].tobytes().decode("ascii")
 
     @staticmethod
     def _to_matrix(pauli, sparse=False, real_valued=False):
@@ -1026,12 +1010,47 @@ class PauliTable(BaseOperator, AdjointMixin):
 
             return csr_matrix((data, indices, indptr), shape=(dim, dim), dtype=dtype)
 
-        # Build dense matrix using csr format
+        # Build dense matrix using csr format. Each row has a single
+        # non-zero entry so it can be filled with one fancy-index assignment
         mat = np.zeros((dim, dim), dtype=dtype)
-        for i in range(dim):
-            mat[i][indices[indptr[i] : indptr[i + 1]]] = data[indptr[i] : indptr[i + 1]]
+        mat[indptr[:-1], indices[:-1]] = data[:-1]
         return mat
 
+    @staticmethod
+    def _to_matrix_array(array, real_valued=False):
+        """Return the rank-3 array of Pauli matrices for a symplectic table.
+
+        Args:
+            array (array): symplectic Pauli table array.
+            real_valued (bool): if True return real Pauli matrices with
+                                Y returned as iY (Default: False).
+        Returns:
+            array: the dense Pauli matrices indexed by table row.
+        """
+        size = array.shape[0]
+        num_qubits = array.shape[1] // 2
+        x = array[:, 0:num_qubits]
+        z = array[:, num_qubits : 2 * num_qubits]
+
+        # Each Pauli matrix has a single non-zero entry in every row, at
+        # the column given by flipping the row index bits on the X qubits
+        dim = 2 ** num_qubits
+        twos_array = 1 << np.arange(num_qubits)
+        rows = np.arange(dim)
+        cols = rows ^ x.dot(twos_array).reshape((size, 1))
+        # The sign is given by the parity of the row index bits on the Z qubits
+        row_bits = (rows.reshape((dim, 1)) >> np.arange(num_qubits)) & 1
+        data = 1 - 2 * (z.astype(int).dot(row_bits.T) & 1)
+        if real_valued:
+            dtype = float
+        else:
+            dtype = complex
+            data = (-1j) ** np.sum(x & z, axis=1).reshape((size, 1)) * data
+
+        ret = np.zeros((size, dim, dim), dtype=dtype)
+        ret[np.arange(size).reshape((size, 1)), rows, cols] = data
+        return ret
+
     # ---------------------------------------------------------------------
     # Custom Iterators
     # ---------------------------------------------------------------------
@@ -1086,5 +1105,37 @@ class PauliTable(BaseOperator, AdjointMixin):
         return MatrixIterator(self)
 
 
+def _row_keys(array, phase=None):
+    """Return a 1D array of byte keys identifying the rows of a boolean array.
+
+    If a boolean phase vector is given its value is included in the key of
+    each row.
+    """
+    # Pack each row into bytes and view it as a single void scalar so
+    # that rows can be compared by a 1D unique instead of an axis=0 one
+    packed = np.packbits(array, axis=1)
+    if phase is not None:
+        packed = np.hstack([packed, phase.reshape((len(array), 1)).astype(np.uint8)])
+    if packed.shape[1] == 0:
+        packed = np.zeros((len(array), 1), dtype=np.uint8)
+    return packed.view(np.dtype((np.void, packed.shape[1]))).ravel()
+
+
+def _label_codes(x, z):
+    """Return the ASCII codes of the Pauli labels of each row of a table."""
+    # Index the label character of each qubit as I=0, X=1, Z=2, Y=3 and
+    # reverse the columns so qubit-0 is the right-most character
+    return _PAULI_LABEL_CODES[x + 2 * z.astype(np.uint8)][:, ::-1]
+
+
+def _labels_from_codes(codes):
+    """Return an array of label strings from a 2D array of ASCII codes."""
+    size, width = codes.shape
+    if width == 0:
+        return np.zeros(size, dtype="<U1")
+    ret = np.ascontiguousarray(codes).view("S{}".format(width)).ravel()
+    return ret.astype("<U{}".format(width))
+
+
 # Update docstrings for API docs
 generate_apidocs(PauliTable)
@@ -133,20 +133,17 @@ def random_clifford(num_qubits, seed=None):
     _fill_tril(delta1, rng)
     _fill_tril(delta2, rng)
 
-    # For large num_qubits numpy.inv function called below can
-    # return invalid output leading to a non-symplectic Clifford
-    # being generated. This can be prevented by manually forcing
-    # block inversion of the matrix.
+    # For large num_qubits the lower-triangular matrices are inverted
+    # using block inversion of the matrix.
     block_inverse_threshold = 50
 
     # Compute stabilizer table
-    zero = np.zeros((num_qubits, num_qubits), dtype=np.int8)
-    prod1 = np.matmul(gamma1, delta1) % 2
-    prod2 = np.matmul(gamma2, delta2) % 2
-    inv1 = _inverse_tril(delta1, block_inverse_threshold).transpose()
-    inv2 = _inverse_tril(delta2, block_inverse_threshold).transpose()
-    table1 = np.block([[delta1, zero], [prod1, inv1]])
-    table2 = np.block([[delta2, zero], [prod2, inv2]])
+    table1 = np.zeros((2 * num_qubits, 2 * num_qubits), dtype=np.int8)
+    table2 = np.zeros((2 * num_qubits, 2 * num_qubits), dtype=np.int8)
+    for symp, gamma, delta in [(table1, gamma1, delta1), (table2, gamma2, delta2)]:
+        symp[:num_qubits, :num_qubits] = delta
+        symp[num_qubits:, :num_qubits] = np.matmul(gamma, delta) % 2
+        symp[num_qubits:, num_qubits:] = _inverse_tril(delta, block_inverse_threshold).T
 
     # Apply qubit permutation
     table = table2[np.concatenate([perm, num_qubits + perm])]
@@ -254,11 +251,14 @@ def _inverse_tril(mat, block_inverse_threshold):
             )
         return inv % 2
 
-    # For higher dimensions we use Numpy's inverse function
-    # however this function tends to fail and result in a non-symplectic
-    # final matrix if n is too large.
+    # For higher dimensions we use forward substitution over GF(2). Each row
+    # of the inverse is the mod 2 sum of the previous rows selected by the
+    # corresponding row of the input matrix.
     if dim <= block_inverse_threshold:
-        return np.linalg.inv(mat).astype(np.int8) % 2
+        inv = np.eye(dim, dtype=np.int8)
+        for i in range(1, dim):
+            inv[i, :i] = np.mod(np.matmul(mat[i, :i], inv[:i, :i]), 2)
+        return inv
 
     # For very large matrices  we divide the matrix into 4 blocks of
     # roughly equal size and use the analytic formula for the inverse
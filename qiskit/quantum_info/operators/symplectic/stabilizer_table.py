@@ -19,7 +19,12 @@ import numpy as np
 
 from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators.custom_iterator import CustomIterator
-from qiskit.quantum_info.operators.symplectic.pauli_table import PauliTable
+from qiskit.quantum_info.operators.symplectic.pauli_table import (
+    PauliTable,
+    _label_codes,
+    _labels_from_codes,
+    _row_keys,
+)
 from qiskit.quantum_info.operators.mixins import generate_apidocs, AdjointMixin
 
 
@@ -216,7 +221,7 @@ class StabilizerTable(PauliTable, AdjointMixin):
     def __eq__(self, other):
         """Test if two StabilizerTables are equal"""
         if isinstance(other, StabilizerTable):
-            return np.all(self._phase == other._phase) and self.pauli == other.pauli
+            return np.array_equal(self._phase, other._phase) and self.pauli == other.pauli
         return False
 
     def copy(self):
@@ -254,7 +259,7 @@ class StabilizerTable(PauliTable, AdjointMixin):
     def __getitem__(self, key):
         """Return a view of StabilizerTable"""
         if isinstance(key, (int, np.integer)):
-            key = [key]
+            return StabilizerTable(self._array[np.newaxis, key], self._phase[np.newaxis, key])
         return StabilizerTable(self._array[key], self._phase[key])
 
     def __setitem__(self, key, value):
@@ -297,9 +302,9 @@ class StabilizerTable(PauliTable, AdjointMixin):
                 "Indices {} are not all less than the size"
                 " of the SatbilizerTable ({})".format(ind, self.size)
             )
-        return StabilizerTable(
-            np.delete(self._array, ind, axis=0), np.delete(self._phase, ind, axis=0)
-        )
+        keep = np.ones(self.size, dtype=bool)
+        keep[ind] = False
+        return StabilizerTable(self._array[keep], self._phase[keep])
 
     def insert(self, ind, value, qubit=False):
         """Insert stabilizers's into the table.
@@ -331,7 +336,7 @@ class StabilizerTable(PauliTable, AdjointMixin):
 
         # Update phase vector
         if not qubit:
-            phase = np.insert(self._phase, ind, value._phase, axis=0)
+            phase = np.concatenate((self._phase[:ind], value._phase, self._phase[ind:]))
         else:
             phase = np.logical_xor(self._phase, value._phase)
         return StabilizerTable(table, phase)
@@ -435,12 +440,12 @@ class StabilizerTable(PauliTable, AdjointMixin):
                 The number of times each of the unique values comes up in the
                 original array. Only provided if ``return_counts`` is True.
         """
-        # Combine array and phases into single array for sorting
-        stack = np.hstack([self._array, self._phase.reshape((self.size, 1))])
+        # Combine packed array rows and phases into single keys for sorting
+        keys = _row_keys(self._array, self._phase)
         if return_counts:
-            _, index, counts = np.unique(stack, return_index=True, return_counts=True, axis=0)
+            _, index, counts = np.unique(keys, return_index=True, return_counts=True)
         else:
-            _, index = np.unique(stack, return_index=True, axis=0)
+            _, index = np.unique(keys, return_index=True)
         # Sort the index so we return unique rows in the original array order
         sort_inds = index.argsort()
         index = index[sort_inds]
@@ -794,13 +799,14 @@ class StabilizerTable(PauliTable, AdjointMixin):
         n_paulis = len(labels)
         if n_paulis == 0:
             raise QiskitError("Input Pauli list is empty.")
-        # Get size from first Pauli
-        pauli, phase = cls._from_label(labels[0])
-        table = np.zeros((n_paulis, len(pauli)), dtype=bool)
-        phases = np.zeros(n_paulis, dtype=bool)
-        table[0], phases[0] = pauli, phase
-        for i in range(1, n_paulis):
-            table[i], phases[i] = cls._from_label(labels[i])
+        # Convert each distinct label once and stack the rows in a
+        # single call
+        symps = {}
+        for label in labels:
+            if label not in symps:
+                symps[label] = cls._from_label(label)
+        table = np.vstack([symps[label][0] for label in labels])
+        phases = np.fromiter((symps[label][1] for label in labels), dtype=bool, count=n_paulis)
         return cls(table, phases)
 
     def to_labels(self, array=False):
@@ -866,9 +872,9 @@ class StabilizerTable(PauliTable, AdjointMixin):
         Returns:
             list or array: The rows of the StabilizerTable in label form.
         """
-        ret = np.zeros(self.size, dtype="<U{}".format(1 + self.num_qubits))
-        for i in range(self.size):
-            ret[i] = self._to_label(self._array[i], self._phase[i])
+        signs = np.where(self._phase, ord("-"), ord("+")).astype(np.uint8)
+        codes = np.hstack([signs.reshape((self.size, 1)), _label_codes(self.X, self.Z)])
+        ret = _labels_from_codes(codes)
         if array:
             return ret
         return ret.tolist()
@@ -949,10 +955,8 @@ class StabilizerTable(PauliTable, AdjointMixin):
         # For efficiency we also allow returning a single rank-3
         # array where first index is the Pauli row, and second two
         # indices are the matrix indices
-        dim = 2 ** self.num_qubits
-        ret = np.zeros((self.size, dim, dim), dtype=float)
-        for i in range(self.size):
-            ret[i] = self._to_matrix(self._array[i], self._phase[i])
+        ret = PauliTable._to_matrix_array(self._array, real_valued=True)
+        ret[self._phase] *= -1
         return ret
 
     @staticmethod
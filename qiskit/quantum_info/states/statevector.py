@@ -759,12 +759,65 @@ class Statevector(QuantumState, TolerancesMixin):
         statevec._op_shape = new_shape
         return statevec
 
+    @staticmethod
+    def _evolve_diagonal(statevec, diag, qargs=None):
+        """Evolve a qubit statevector by a diagonal gate given by its diagonal"""
+        dim = len(diag)
+        statevec._op_shape.compose(OpShape.auto(shape=(dim, dim)), qargs=qargs)
+        if qargs is None:
+            # Full system evolution
+            statevec._data = diag * statevec._data
+            return statevec
+
+        # Get transpose axes
+        num_qargs = statevec._op_shape.num_qargs[0]
+        indices = [num_qargs - 1 - i for i in reversed(qargs)]
+        axes = indices + [i for i in range(num_qargs) if i not in indices]
+        axes_inv = np.argsort(axes).tolist()
+        tensor_shape = statevec._op_shape.tensor_shape
+        contract_shape = (dim, statevec._op_shape.shape[0] // dim)
+
+        # Multiply the contracted subsystems elementwise by the diagonal
+        data = np.reshape(
+            np.transpose(np.reshape(statevec.data, tensor_shape), axes), contract_shape
+        )
+        data = np.reshape(diag[:, None] * data, [tensor_shape[i] for i in axes])
+        statevec._data = np.reshape(np.transpose(data, axes_inv), statevec._op_shape.shape[0])
+        return statevec
+
+    @staticmethod
+    def _evolve_xx_rotation(statevec, coeff_i, coeff_xx, qargs=None):
+        """Evolve a qubit statevector by the operator coeff_i * I + coeff_xx * XX"""
+        statevec._op_shape.compose(OpShape.auto(shape=(4, 4)), qargs=qargs)
+        if qargs is None:
+            # Flipping both qubits reverses a 2-qubit statevector
+            flipped = statevec._data[::-1]
+        else:
+            # Flipping a qubit reverses its axis of the statevector tensor
+            num_qargs = statevec._op_shape.num_qargs[0]
+            flipped = np.reshape(
+                np.flip(
+                    np.reshape(statevec._data, statevec._op_shape.tensor_shape),
+                    axis=[num_qargs - 1 - i for i in qargs],
+                ),
+                statevec._op_shape.shape[0],
+            )
+        statevec._data = coeff_i * statevec._data + coeff_xx * flipped
+        return statevec
+
     @staticmethod
     def _evolve_instruction(statevec, obj, qargs=None):
         """Update the current Statevector by applying an instruction."""
         from qiskit.circuit.reset import Reset
         from qiskit.circuit.barrier import Barrier
 
+        if hasattr(obj, "_diagonal"):
+            # Diagonal gates are applied by elementwise multiplication
+            return Statevector._evolve_diagonal(statevec, obj._diagonal(), qargs=qargs)
+        if hasattr(obj, "_partials"):
+            # XX-rotations are applied as a scaled pairwise swap of amplitudes
+            return Statevector._evolve_xx_rotation(statevec, *obj._partials(), qargs=qargs)
+
         mat = Operator._instruction_to_matrix(obj)
         if mat is not None:
             # Perform the composition and inplace update the current state
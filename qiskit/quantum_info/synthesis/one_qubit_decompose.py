@@ -17,7 +17,6 @@ Decompose a single-qubit unitary via Euler angles.
 import math
 import cmath
 import numpy as np
-import scipy.linalg as la
 
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.circuit.quantumregister import QuantumRegister
@@ -218,17 +217,22 @@ class OneQubitEulerDecomposer:
         """Return the Euler angles and phase for the ZYZ basis."""
         # We rescale the input matrix to be special unitary (det(U) = 1)
         # This ensures that the quaternion representation is real
-        coeff = la.det(mat) ** (-0.5)
+        # The matrix is only 2x2 so we work with its scalar entries
+        # directly rather than dispatching to array routines
+        mat00, mat01 = complex(mat[0, 0]), complex(mat[0, 1])
+        mat10, mat11 = complex(mat[1, 0]), complex(mat[1, 1])
+        coeff = (mat00 * mat11 - mat01 * mat10) ** (-0.5)
         phase = -cmath.phase(coeff)
-        su_mat = coeff * mat  # U in SU(2)
+        # U in SU(2)
+        su00, su10, su11 = coeff * mat00, coeff * mat10, coeff * mat11
         # OpenQASM SU(2) parameterization:
         # U[0, 0] = exp(-i(phi+lambda)/2) * cos(theta/2)
         # U[0, 1] = -exp(-i(phi-lambda)/2) * sin(theta/2)
         # U[1, 0] = exp(i(phi-lambda)/2) * sin(theta/2)
         # U[1, 1] = exp(i(phi+lambda)/2) * cos(theta/2)
-        theta = 2 * math.atan2(abs(su_mat[1, 0]), abs(su_mat[0, 0]))
-        phiplambda2 = cmath.phase(su_mat[1, 1])
-        phimlambda2 = cmath.phase(su_mat[1, 0])
+        theta = 2 * math.atan2(abs(su10), abs(su00))
+        phiplambda2 = cmath.phase(su11)
+        phimlambda2 = cmath.phase(su10)
         phi = phiplambda2 + phimlambda2
         lam = phiplambda2 - phimlambda2
         return theta, phi, lam, phase
@@ -36,6 +36,9 @@ class InstructionDurations:
         self.duration_by_name = {}
         self.duration_by_name_qubits = {}
         self.dt = dt
+        # Cache of unit converted table durations keyed by
+        # (duration, type(duration), from_unit, to_unit, dt)
+        self._converted_durations = {}
         if instruction_durations:
             self.update(instruction_durations)
 
@@ -193,7 +196,15 @@ class InstructionDurations:
         else:
             raise TranspilerError("No value is found for key={}".format(key))
 
-        return self._convert_unit(duration, unit, to_unit)
+        if isinstance(duration, ParameterExpression):
+            return self._convert_unit(duration, unit, to_unit)
+        # The same few table durations are converted for every node of a
+        # circuit so we only compute (and warn about rounding) once. The type
+        # is part of the key since equal values like 1, 1.0 and True share a hash
+        conv_key = (duration, type(duration), unit, to_unit, self.dt)
+        if conv_key not in self._converted_durations:
+            self._converted_durations[conv_key] = self._convert_unit(duration, unit, to_unit)
+        return self._converted_durations[conv_key]
 
     def _convert_unit(self, duration: float, from_unit: str, to_unit: str) -> Union[float, int]:
         if from_unit.endswith("s") and from_unit != "s":
@@ -211,21 +211,21 @@ class HoareOptimizer(TransformationPass):
         """
         assert len(sequence) == 2
 
-        gate1, gate2 = sequence[0].op, sequence[1].op.inverse()
-        par1, par2 = gate1.params, gate2.params
-        def1, def2 = gate1.definition, gate2.definition
+        op1, op2 = sequence[0].op, sequence[1].op
+        # self-inverse gates compare equal to their inverse, so skip building it
+        if not getattr(op2, "_is_self_inverse", False):
+            op2 = op2.inverse()
+        par1, par2 = op1.params, op2.params
 
-        if isinstance(gate1, ControlledGate):
-            gate1 = gate1.base_gate
-        gate1 = type(gate1)
-        if isinstance(gate2, ControlledGate):
-            gate2 = gate2.base_gate
-        gate2 = type(gate2)
+        gate1 = type(op1.base_gate if isinstance(op1, ControlledGate) else op1)
+        gate2 = type(op2.base_gate if isinstance(op2, ControlledGate) else op2)
 
         # equality of gates can be determined via type and parameters, unless
         # the gates have no specific type, in which case definition is used
-        # or they are unitary gates, in which case matrix equality is used
+        # or they are unitary gates, in which case matrix equality is used.
+        # Definitions are only built when they are needed for the comparison.
         if gate1 is Gate and gate2 is Gate:
+            def1, def2 = op1.definition, op2.definition
             return def1 == def2 and def1 and def2
         elif gate1 is UnitaryGate and gate2 is UnitaryGate:
             return matrix_equal(par1[0], par2[0], ignore_phase=True)
@@ -1439,6 +1439,32 @@ class TestStandardMethods(QiskitTestCase):
             self.assertTrue(matrix_equal(definition_unitary, gate_matrix))
             self.assertTrue(is_unitary_matrix(gate_matrix))
 
+    def test_self_inverse(self):
+        """test gates flagged as self-inverse are equal to their inverse."""
+        from qiskit.circuit.library import standard_gates
+        from qiskit.extensions.simulator.snapshot import Snapshot
+
+        for gate_class in vars(standard_gates).values():
+            if not getattr(gate_class, "_is_self_inverse", False):
+                continue
+            with self.subTest(gate_class):
+                gate = gate_class()
+                self.assertEqual(gate.inverse(), gate)
+                self.assertTrue(matrix_equal(gate.inverse().to_matrix(), gate.to_matrix()))
+
+        snapshot = Snapshot("snap", num_qubits=2)
+        self.assertEqual(snapshot.inverse(), snapshot)
+        self.assertEqual(snapshot.inverse().label, "snap")
+
+    def test_snapshot_overlapping_registers(self):
+        """test snapshot on all qubits raises for registers sharing bits."""
+        from qiskit.circuit import Qubit
+        from qiskit.extensions.exceptions import ExtensionError
+
+        bits = [Qubit() for _ in range(3)]
+        circuit = QuantumCircuit(QuantumRegister(bits=bits[:2]), QuantumRegister(bits=bits[1:]))
+        self.assertRaises(ExtensionError, circuit.snapshot, "snap")
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
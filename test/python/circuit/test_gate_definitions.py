@@ -14,12 +14,13 @@
 """Test hardcoded decomposition rules and matrix definitions for standard gates."""
 
 import inspect
+from unittest.mock import patch
 
 import numpy as np
 from ddt import ddt, data, unpack
 
 from qiskit import QuantumCircuit, QuantumRegister
-from qiskit.quantum_info import Operator
+from qiskit.quantum_info import Operator, Pauli
 from qiskit.test import QiskitTestCase
 from qiskit.circuit import ParameterVector, Gate, ControlledGate
 
@@ -54,6 +55,8 @@ from qiskit.circuit.library import (
     ZGate,
     CZGate,
     RYYGate,
+    RXXGate,
+    RZZGate,
     PhaseGate,
     CPhaseGate,
     UGate,
@@ -170,6 +173,50 @@ class TestGateDefinitions(QiskitTestCase):
         rv = RVGate(0, 0, 0)
         self.assertTrue(np.array_equal(rv.to_matrix(), np.array([[1, 0], [0, 1]])))
 
+    def test_cached_matrix_not_shared(self):
+        """Test mutating a gate matrix does not change matrices of equal gates."""
+        for gate in [RGate(0.1, 0.2), RYGate(0.3), RXXGate(0.4), RZZGate(0.5), U2Gate(0.6, 0.7)]:
+            with self.subTest(gate=gate.name):
+                mat = gate.to_matrix()
+                target = mat.copy()
+                mat[:] = 0
+                self.assertTrue(np.array_equal(type(gate)(*gate.params).to_matrix(), target))
+
+    def test_batch_matrices(self):
+        """Test batched rotation matrices match the single gate matrices."""
+        thetas = np.linspace(-np.pi, np.pi, 7)
+        phis = np.linspace(0, 2 * np.pi, 7)
+        for gate_class in [RYGate, RXXGate, RZZGate]:
+            with self.subTest(gate=gate_class.__name__):
+                target = np.array([gate_class(theta).to_matrix() for theta in thetas])
+                np.testing.assert_allclose(gate_class.batch_matrices(thetas), target)
+        with self.subTest(gate="RGate"):
+            target = np.array([RGate(theta, phi).to_matrix() for theta, phi in zip(thetas, phis)])
+            np.testing.assert_allclose(RGate.batch_matrices(thetas, phis), target)
+
+    def test_to_pauli_rotation(self):
+        """Test two-qubit Pauli rotation gates report their Pauli label and angle."""
+        for gate_class in [RXXGate, RYYGate, RZZGate]:
+            with self.subTest(gate=gate_class.__name__):
+                label, theta = gate_class(0.7).to_pauli_rotation()
+                pauli = Pauli(label).to_matrix()
+                target = np.cos(theta / 2) * np.eye(4) - 1j * np.sin(theta / 2) * pauli
+                np.testing.assert_allclose(gate_class(0.7).to_matrix(), target, atol=1e-12)
+
+    def test_ry_batch_matrices_without_numba(self):
+        """Test batched RY matrices fall back to numpy without numba."""
+        thetas = np.linspace(-np.pi, np.pi, 7).reshape(7, 1)
+        target = np.array([[RYGate(theta).to_matrix()] for theta in thetas[:, 0]])
+        with patch("qiskit.circuit.library.standard_gates.ry._ry_batch_kernel", return_value=None):
+            np.testing.assert_allclose(RYGate.batch_matrices(thetas), target)
+
+    def test_ry_batch_matrices_kernel(self):
+        """Test batched RY matrices from the compiled kernel path."""
+        thetas = np.linspace(-np.pi, np.pi, 7).reshape(7, 1)
+        target = np.array([[RYGate(theta).to_matrix()] for theta in thetas[:, 0]])
+        with patch("qiskit.circuit.library.standard_gates.ry._RY_BATCH_KERNEL_MIN_SIZE", 1):
+            np.testing.assert_allclose(RYGate.batch_matrices(thetas), target)
+
 
 @ddt
 class TestStandardGates(QiskitTestCase):
@@ -77,6 +77,46 @@ class TestSuperOp(ChannelTestCase):
         )
         self.assertEqual(target, op)
 
+    def test_circuit_init_repeated_gates(self):
+        """Test initialization from a circuit with repeated gates."""
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.h(0)
+        circuit.cx(0, 1, ctrl_state=0)
+        circuit.h(0)
+        op = SuperOp(circuit)
+        target = SuperOp(Operator(circuit))
+        self.assertEqual(target, op)
+        # Cached gate superoperators must not leak into the result
+        op._data[0, 0] = 0
+        self.assertEqual(SuperOp(circuit), target)
+
+    def test_circuit_init_consecutive_gates(self):
+        """Test initialization from a circuit with consecutive gates on the same qubits."""
+        inner = QuantumCircuit(2, name="inner")
+        inner.h(1)
+        inner.cx(1, 0)
+        circuit = QuantumCircuit(3)
+        circuit.h(0)
+        circuit.i(0)
+        circuit.t(0)
+        circuit.barrier()
+        circuit.delay(10, 0)
+        circuit.sx(0)
+        circuit.cx(0, 2)
+        circuit.cx(0, 2)
+        circuit.ry(0.3, 2)
+        circuit.append(inner.to_gate(), [2, 0])
+        circuit.rz(0.2, 2)
+        circuit.reset(1)
+        circuit.s(1)
+        op = SuperOp(circuit)
+        target = SuperOp(np.eye(64))
+        for instr, qargs, _ in circuit:
+            target = target.compose(SuperOp(instr), qargs=[circuit.qubits.index(q) for q in qargs])
+        self.assertEqual(target, op)
+
     def test_circuit_init_except(self):
         """Test initialization from circuit with measure raises exception."""
         circuit = self.simple_circuit_with_measure()
@@ -189,6 +229,16 @@ class TestSuperOp(ChannelTestCase):
         rho_test = rho.evolve(op, qargs=[2, 1, 0])
         self.assertEqual(rho_test, rho_targ)
 
+    def test_evolve_subsystem_large(self):
+        """Test subsystem evolve method on a 6-qubit state."""
+        rho = DensityMatrix(self.rand_rho(64))
+        mat = self.rand_matrix(4, 4)
+        for qargs in [[0, 1], [4, 1], [5, 2]]:
+            with self.subTest(qargs=qargs):
+                rho_targ = rho.evolve(Operator(mat), qargs=qargs)
+                rho_test = rho.evolve(SuperOp(Operator(mat)), qargs=qargs)
+                self.assertEqual(rho_test, rho_targ)
+
     def test_is_cptp(self):
         """Test is_cptp method."""
         self.assertTrue(SuperOp(self.depol_sop(0.25)).is_cptp())
@@ -532,6 +582,12 @@ class TestSuperOp(ChannelTestCase):
         targ3 = SuperOp(self.depol_sop(1 - p_id3))
         self.assertEqual(chan3, targ3)
 
+        # Compose 50 times
+        p_id50 = p_id ** 50
+        chan50 = depol.power(50)
+        targ50 = SuperOp(self.depol_sop(1 - p_id50))
+        self.assertEqual(chan50, targ50)
+
     def test_add(self):
         """Test add method."""
         mat1 = 0.5 * self.sopI
@@ -14,8 +14,9 @@
 """Tests for Clifford class."""
 
 import unittest
+from unittest.mock import patch
 from test import combine
-from ddt import ddt
+from ddt import ddt, data, unpack
 
 import numpy as np
 
@@ -34,7 +35,11 @@ from qiskit.circuit.library import (
     CZGate,
     SwapGate,
 )
-from qiskit.quantum_info.operators import Clifford, Operator
+from qiskit.quantum_info.operators import Clifford, Operator, StabilizerTable
+from qiskit.quantum_info.operators.symplectic.clifford import (
+    _compose_1q_table,
+    _compose_phase_loop,
+)
 from qiskit.quantum_info.operators.symplectic.clifford_circuits import _append_circuit
 from qiskit.quantum_info.synthesis.clifford_decompose import (
     decompose_clifford_ag,
@@ -105,12 +110,18 @@ def random_clifford_circuit(num_qubits, num_gates, gates="all", seed=None):
 
     samples = rng.choice(gates, num_gates)
 
+    # Sample qubits for all gates at once. The second qubit is offset from
+    # the first by a non-zero shift so 2-qubit gates act on distinct qubits
+    qargs = np.empty((num_gates, 2), dtype=int)
+    qargs[:, 0] = rng.integers(0, num_qubits, size=num_gates)
+    shifts = rng.integers(1, max(num_qubits, 2), size=num_gates)
+    qargs[:, 1] = (qargs[:, 0] + shifts) % num_qubits
+
     circ = QuantumCircuit(num_qubits)
 
-    for name in samples:
+    for name, qarg in zip(samples, qargs.tolist()):
         gate, nqargs = instructions[name]
-        qargs = rng.choice(range(num_qubits), nqargs, replace=False).tolist()
-        circ.append(gate, qargs)
+        circ.append(gate, qarg[:nqargs])
 
     return circ
 
@@ -119,37 +130,38 @@ def random_clifford_circuit(num_qubits, num_gates, gates="all", seed=None):
 class TestCliffordGates(QiskitTestCase):
     """Tests for clifford append gate functions."""
 
-    def test_append_1_qubit_gate(self):
-        """Tests for append of 1-qubit gates"""
+    @data("i", "id", "iden", "x", "y", "z", "h", "s", "sdg", "v", "w")
+    def test_append_1_qubit_gate(self, gate_name):
+        """Tests for append of 1-qubit gate {gate_name}"""
 
         target_table = {
-            "i": np.array([[[True, False], [False, True]]], dtype=bool),
-            "id": np.array([[[True, False], [False, True]]], dtype=bool),
-            "iden": np.array([[[True, False], [False, True]]], dtype=bool),
-            "x": np.array([[[True, False], [False, True]]], dtype=bool),
-            "y": np.array([[[True, False], [False, True]]], dtype=bool),
-            "z": np.array([[[True, False], [False, True]]], dtype=bool),
-            "h": np.array([[[False, True], [True, False]]], dtype=bool),
-            "s": np.array([[[True, True], [False, True]]], dtype=bool),
-            "sdg": np.array([[[True, True], [False, True]]], dtype=bool),
-            "sinv": np.array([[[True, True], [False, True]]], dtype=bool),
-            "v": np.array([[[True, True], [True, False]]], dtype=bool),
-            "w": np.array([[[False, True], [True, True]]], dtype=bool),
+            "i": np.array([[True, False], [False, True]], dtype=bool),
+            "id": np.array([[True, False], [False, True]], dtype=bool),
+            "iden": np.array([[True, False], [False, True]], dtype=bool),
+            "x": np.array([[True, False], [False, True]], dtype=bool),
+            "y": np.array([[True, False], [False, True]], dtype=bool),
+            "z": np.array([[True, False], [False, True]], dtype=bool),
+            "h": np.array([[False, True], [True, False]], dtype=bool),
+            "s": np.array([[True, True], [False, True]], dtype=bool),
+            "sdg": np.array([[True, True], [False, True]], dtype=bool),
+            "sinv": np.array([[True, True], [False, True]], dtype=bool),
+            "v": np.array([[True, True], [True, False]], dtype=bool),
+            "w": np.array([[False, True], [True, True]], dtype=bool),
         }
 
         target_phase = {
-            "i": np.array([[False, False]], dtype=bool),
-            "id": np.array([[False, False]], dtype=bool),
-            "iden": np.array([[False, False]], dtype=bool),
-            "x": np.array([[False, True]], dtype=bool),
-            "y": np.array([[True, True]], dtype=bool),
-            "z": np.array([[True, False]], dtype=bool),
-            "h": np.array([[False, False]], dtype=bool),
-            "s": np.array([[False, False]], dtype=bool),
-            "sdg": np.array([[True, False]], dtype=bool),
-            "sinv": np.array([[True, False]], dtype=bool),
-            "v": np.array([[False, False]], dtype=bool),
-            "w": np.array([[False, False]], dtype=bool),
+            "i": np.array([False, False], dtype=bool),
+            "id": np.array([False, False], dtype=bool),
+            "iden": np.array([False, False], dtype=bool),
+            "x": np.array([False, True], dtype=bool),
+            "y": np.array([True, True], dtype=bool),
+            "z": np.array([True, False], dtype=bool),
+            "h": np.array([False, False], dtype=bool),
+            "s": np.array([False, False], dtype=bool),
+            "sdg": np.array([True, False], dtype=bool),
+            "sinv": np.array([True, False], dtype=bool),
+            "v": np.array([False, False], dtype=bool),
+            "w": np.array([False, False], dtype=bool),
         }
 
         target_stabilizer = {
@@ -182,91 +194,73 @@ class TestCliffordGates(QiskitTestCase):
             "w": "+Z",
         }
 
-        for gate_name in ("i", "id", "iden", "x", "y", "z", "h", "s", "sdg", "v", "w"):
-            with self.subTest(msg="append gate %s" % gate_name):
-                cliff = Clifford([[1, 0], [0, 1]])
-                cliff = _append_circuit(cliff, gate_name, [0])
-                value_table = cliff.table._array
-                value_phase = cliff.table._phase
-                value_stabilizer = cliff.stabilizer.to_labels()
-                value_destabilizer = cliff.destabilizer.to_labels()
-                self.assertTrue(np.all(np.array(value_table == target_table[gate_name])))
-                self.assertTrue(np.all(np.array(value_phase == target_phase[gate_name])))
-                self.assertTrue(
-                    np.all(np.array(value_stabilizer == [target_stabilizer[gate_name]]))
-                )
-                self.assertTrue(
-                    np.all(np.array(value_destabilizer == [target_destabilizer[gate_name]]))
-                )
-
-    def test_1_qubit_identity_relations(self):
-        """Tests identity relations for 1-qubit gates"""
-
-        for gate_name in ("x", "y", "z", "h"):
-            with self.subTest(msg="identity for gate %s" % gate_name):
-                cliff = Clifford([[1, 0], [0, 1]])
-                cliff1 = cliff.copy()
-                cliff = _append_circuit(cliff, gate_name, [0])
-                cliff = _append_circuit(cliff, gate_name, [0])
-                self.assertEqual(cliff, cliff1)
-
-        gates = ["s", "s", "v"]
-        inv_gates = ["sdg", "sinv", "w"]
-
-        for gate_name, inv_gate in zip(gates, inv_gates):
-            with self.subTest(msg="identity for gate %s" % gate_name):
-                cliff = Clifford([[1, 0], [0, 1]])
-                cliff1 = cliff.copy()
-                cliff = _append_circuit(cliff, gate_name, [0])
-                cliff = _append_circuit(cliff, inv_gate, [0])
-                self.assertEqual(cliff, cliff1)
-
-    def test_1_qubit_mult_relations(self):
-        """Tests multiplicity relations for 1-qubit gates"""
-
-        rels = [
-            "x * y = z",
-            "x * z = y",
-            "y * z = x",
-            "s * s = z",
-            "sdg * sdg = z",
-            "sinv * sinv = z",
-            "sdg * h = v",
-            "h * s = w",
-        ]
-
-        for rel in rels:
-            with self.subTest(msg="relation %s" % rel):
-                split_rel = rel.split()
-                cliff = Clifford([[1, 0], [0, 1]])
-                cliff1 = cliff.copy()
-                cliff = _append_circuit(cliff, split_rel[0], [0])
-                cliff = _append_circuit(cliff, split_rel[2], [0])
-                cliff1 = _append_circuit(cliff1, split_rel[4], [0])
-                self.assertEqual(cliff, cliff1)
-
-    def test_1_qubit_conj_relations(self):
-        """Tests conjugation relations for 1-qubit gates"""
-
-        rels = [
-            "h * x * h = z",
-            "h * y * h = y",
-            "s * x * sdg = y",
-            "w * x * v = y",
-            "w * y * v = z",
-            "w * z * v = x",
-        ]
-
-        for rel in rels:
-            with self.subTest(msg="relation %s" % rel):
-                split_rel = rel.split()
-                cliff = Clifford([[1, 0], [0, 1]])
-                cliff1 = cliff.copy()
-                cliff = _append_circuit(cliff, split_rel[0], [0])
-                cliff = _append_circuit(cliff, split_rel[2], [0])
-                cliff = _append_circuit(cliff, split_rel[4], [0])
-                cliff1 = _append_circuit(cliff1, split_rel[6], [0])
-                self.assertEqual(cliff, cliff1)
+        cliff = Clifford([[1, 0], [0, 1]])
+        cliff = _append_circuit(cliff, gate_name, [0])
+        value_table = cliff.table._array
+        value_phase = cliff.table._phase
+        value_stabilizer = cliff.stabilizer.to_labels()
+        value_destabilizer = cliff.destabilizer.to_labels()
+        self.assertTrue(np.array_equal(value_table, target_table[gate_name]))
+        self.assertTrue(np.array_equal(value_phase, target_phase[gate_name]))
+        self.assertEqual(value_stabilizer, [target_stabilizer[gate_name]])
+        self.assertEqual(value_destabilizer, [target_destabilizer[gate_name]])
+
+    @data(
+        ("x", "x"),
+        ("y", "y"),
+        ("z", "z"),
+        ("h", "h"),
+        ("s", "sdg"),
+        ("s", "sinv"),
+        ("v", "w"),
+    )
+    @unpack
+    def test_1_qubit_identity_relations(self, gate_name, inv_gate):
+        """Tests identity relation for 1-qubit gates {gate_name} and {inv_gate}"""
+        cliff = Clifford([[1, 0], [0, 1]])
+        cliff1 = cliff.copy()
+        cliff = _append_circuit(cliff, gate_name, [0])
+        cliff = _append_circuit(cliff, inv_gate, [0])
+        self.assertEqual(cliff, cliff1)
+
+    @data(
+        "x * y = z",
+        "x * z = y",
+        "y * z = x",
+        "s * s = z",
+        "sdg * sdg = z",
+        "sinv * sinv = z",
+        "sdg * h = v",
+        "h * s = w",
+    )
+    def test_1_qubit_mult_relations(self, rel):
+        """Tests multiplicity relation {rel} for 1-qubit gates"""
+        split_rel = rel.split()
+        cliff = Clifford([[1, 0], [0, 1]])
+        cliff1 = cliff.copy()
+        cliff = _append_circuit(cliff, split_rel[0], [0])
+        cliff = _append_circuit(cliff, split_rel[2], [0])
+        cliff1 = _append_circuit(cliff1, split_rel[4], [0])
+        self.assertEqual(cliff, cliff1)
+
+    @data(
+        "h * x * h = z",
+        "h * y * h = y",
+        "s * x * sdg = y",
+        "w * x * v = y",
+        "w * y * v = z",
+        "w * z * v = x",
+    )
+    def test_1_qubit_conj_relations(self, rel):
+        """Tests conjugation relation {rel} for 1-qubit gates"""
+        split_rel = rel.split()
+        cliff = Clifford([[1, 0], [0, 1]])
+        cliff1 = cliff.copy()
+        cliff = _append_circuit(cliff, split_rel[0], [0])
+        cliff = _append_circuit(cliff, split_rel[2], [0])
+        cliff = _append_circuit(cliff, split_rel[4], [0])
+        cliff1 = _append_circuit(cliff1, split_rel[6], [0])
+        self.assertEqual(cliff, cliff1)
 
     @combine(gate_name=("cx", "cz", "swap"), qubits=([0, 1], [1, 0]))
     def test_append_2_qubit_gate(self, gate_name, qubits):
@@ -328,17 +322,14 @@ class TestCliffordGates(QiskitTestCase):
         target = targets_cliffords[gate_qubits]
         self.assertEqual(target, cliff)
 
-    def test_2_qubit_identity_relations(self):
-        """Tests identity relations for 2-qubit gates"""
-
-        for gate_name in ("cx", "cz", "swap"):
-            for qubits in ([0, 1], [1, 0]):
-                with self.subTest(msg="append gate %s %s" % (gate_name, qubits)):
-                    cliff = Clifford(np.eye(4))
-                    cliff1 = cliff.copy()
-                    cliff = _append_circuit(cliff, gate_name, qubits)
-                    cliff = _append_circuit(cliff, gate_name, qubits)
-                    self.assertEqual(cliff, cliff1)
+    @combine(gate_name=("cx", "cz", "swap"), qubits=([0, 1], [1, 0]))
+    def test_2_qubit_identity_relations(self, gate_name, qubits):
+        """Tests identity relations for 2-qubit gate {gate_name} {qubits}"""
+        cliff = Clifford(np.eye(4))
+        cliff1 = cliff.copy()
+        cliff = _append_circuit(cliff, gate_name, qubits)
+        cliff = _append_circuit(cliff, gate_name, qubits)
+        self.assertEqual(cliff, cliff1)
 
     def test_2_qubit_relations(self):
         """Tests relations for 2-qubit gates"""
@@ -641,6 +632,38 @@ class TestCliffordOperators(QiskitTestCase):
             target = Clifford(circ1.extend(circ2))
             self.assertEqual(target, value)
 
+    def test_compose_1q(self):
+        """Test compose of all pairs of single-qubit Cliffords"""
+        _, _, arrays, phases = _compose_1q_table()
+        cliffs = [Clifford(StabilizerTable(array, phase)) for array, phase in zip(arrays, phases)]
+        self.assertEqual(len(cliffs), 24)
+        for cliff1 in cliffs:
+            for cliff2 in cliffs:
+                with self.subTest(cliff1=cliff1, cliff2=cliff2):
+                    target = Clifford(cliff1.to_circuit().compose(cliff2.to_circuit()))
+                    self.assertEqual(cliff1.compose(cliff2), target)
+                    self.assertEqual(cliff2.compose(cliff1, front=True), target)
+
+    @combine(num_qubits=[2, 3, 5], kernel=[None, _compose_phase_loop])
+    def test_compose_phase_kernel(self, num_qubits, kernel):
+        """Test {num_qubits}-qubit compose with phase kernel {kernel}"""
+        samples = 10
+        num_gates = 10
+        seed = 700
+        for i in range(samples):
+            circ1 = random_clifford_circuit(num_qubits, num_gates, seed=seed + i)
+            circ2 = random_clifford_circuit(num_qubits, num_gates, seed=seed + samples + i)
+            cliff1 = Clifford(circ1)
+            cliff2 = Clifford(circ2)
+            # Composing with a circuit appends its gates without the phase kernel
+            target = cliff1.compose(circ2)
+            with patch(
+                "qiskit.quantum_info.operators.symplectic.clifford._compose_phase_kernel",
+                return_value=kernel,
+            ):
+                value = cliff1.compose(cliff2)
+            self.assertEqual(target, value)
+
     @combine(num_qubits=[1, 2, 3])
     def test_dot_method(self, num_qubits):
         """Test dot method"""
@@ -821,6 +844,14 @@ class TestCliffordOperators(QiskitTestCase):
         clifford = random_clifford(2, seed=777)
         self.assertEqual(clifford.to_instruction().name, str(clifford))
 
+    @combine(num_qubits=[24, 30])
+    def test_random_clifford_valid_large(self, num_qubits):
+        """Test random_clifford returns a valid {num_qubits}-qubit Clifford"""
+        for seed in range(5):
+            clifford = random_clifford(num_qubits, seed=seed)
+            self.assertEqual(clifford.num_qubits, num_qubits)
+            self.assertTrue(clifford.is_unitary())
+
 
 if __name__ == "__main__":
     unittest.main()
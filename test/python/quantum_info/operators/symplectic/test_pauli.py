@@ -154,6 +154,19 @@ class TestPauliProperties(QiskitTestCase):
         value = _phase_from_label(coeff)
         self.assertEqual(value, phase)
 
+    @data(1.0, np.array(2.0), np.float64(3))
+    def test_float_phase(self, phase):
+        """Test Pauli initialized with a float phase"""
+        pauli = Pauli(([True, False], [True, True], phase))
+        target = Pauli(([True, False], [True, True], int(phase)))
+        self.assertEqual(pauli.phase, int(phase))
+        self.assertEqual(pauli, target)
+        self.assertEqual(pauli.compose(pauli), target.compose(target))
+        self.assertEqual(-pauli, -target)
+        self.assertEqual(1j * pauli, 1j * target)
+        pauli.phase = float(phase)
+        self.assertEqual(pauli.phase, int(phase))
+
     def test_x_setter(self):
         """Test phase attribute"""
         pauli = Pauli("II")
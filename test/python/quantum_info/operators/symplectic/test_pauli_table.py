@@ -279,6 +279,12 @@ class TestPauliTableProperties(QiskitTestCase):
             self.assertEqual(pauli[0], PauliTable(labels[0]))
             self.assertEqual(pauli[1], PauliTable(labels[1]))
 
+        with self.subTest(msg="__getitem__ single view"):
+            pauli = PauliTable.from_labels(["XX", "ZZ"])
+            row = pauli[0]
+            row.array[0, 0] = False
+            self.assertEqual(pauli, PauliTable.from_labels(["XI", "ZZ"]))
+
         with self.subTest(msg="__getitem__ array"):
             labels = np.array(["XI", "IY", "IZ", "XY", "ZX"])
             pauli = PauliTable.from_labels(labels)
@@ -333,6 +333,13 @@ class TestStabilizerTableProperties(QiskitTestCase):
             self.assertEqual(stab[0], StabilizerTable(labels[0]))
             self.assertEqual(stab[1], StabilizerTable(labels[1]))
 
+        with self.subTest(msg="__getitem__ single view"):
+            stab = StabilizerTable.from_labels(["+XX", "-ZZ"])
+            row = stab[0]
+            row.phase = True
+            row.array[0, 0] = False
+            self.assertEqual(stab, StabilizerTable.from_labels(["-XI", "-ZZ"]))
+
         with self.subTest(msg="__getitem__ array"):
             labels = np.array(["+XI", "-IY", "+IZ", "-XY", "+ZX"])
             stab = StabilizerTable.from_labels(labels)
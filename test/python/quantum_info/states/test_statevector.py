@@ -24,7 +24,7 @@ from qiskit.test import QiskitTestCase
 from qiskit import QiskitError
 from qiskit import QuantumRegister, QuantumCircuit
 from qiskit import transpile
-from qiskit.circuit.library import HGate, QFT
+from qiskit.circuit.library import HGate, QFT, RZGate, RZZGate, RXXGate, PhaseGate
 from qiskit.providers.basicaer import QasmSimulatorPy
 
 from qiskit.quantum_info.random import random_unitary, random_statevector, random_pauli
@@ -293,6 +293,32 @@ class TestStatevector(QiskitTestCase):
             target = Statevector(np.dot(op_full.data, vec))
             self.assertEqual(state.evolve(op, qargs=[2, 1, 0]), target)
 
+    def test_evolve_diagonal_gate(self):
+        """Test evolve by diagonal gates on subsystems."""
+        vec = self.rand_vec(8)
+        state = Statevector(vec)
+        for gate in [RZGate(0.3), PhaseGate(-1.2)]:
+            for qargs in [[0], [1], [2]]:
+                with self.subTest(gate=gate.name, qargs=qargs):
+                    target = state.evolve(Operator(gate), qargs=qargs)
+                    self.assertEqual(state.evolve(gate, qargs=qargs), target)
+        gate = RZZGate(0.7)
+        for qargs in [[0, 1], [2, 0], [1, 2]]:
+            with self.subTest(gate=gate.name, qargs=qargs):
+                target = state.evolve(Operator(gate), qargs=qargs)
+                self.assertEqual(state.evolve(gate, qargs=qargs), target)
+
+    def test_evolve_rxx_gate(self):
+        """Test evolve by an RXX gate on subsystems."""
+        gate = RXXGate(0.7)
+        state = Statevector(self.rand_vec(4))
+        self.assertEqual(state.evolve(gate), state.evolve(Operator(gate)))
+        state = Statevector(self.rand_vec(8))
+        for qargs in [[0, 1], [2, 0], [1, 2]]:
+            with self.subTest(qargs=qargs):
+                target = state.evolve(Operator(gate), qargs=qargs)
+                self.assertEqual(state.evolve(gate, qargs=qargs), target)
+
     def test_evolve_global_phase(self):
         """Test evolve circuit with global phase."""
         state_i = Statevector([1, 0])
@@ -80,3 +80,27 @@ class TestInstructionDurationsClass(QiskitTestCase):
         parameterized_delay = Delay(param, "s")
         with self.assertRaises(TranspilerError):
             InstructionDurations().get(parameterized_delay, 0)
+
+    def test_cached_conversion_is_reused(self):
+        durations = InstructionDurations([("x", [0], 160, "dt")], dt=1e-9)
+        first = durations.get("x", [0], unit="s")
+        self.assertAlmostEqual(first, 1.6e-7)
+        self.assertEqual(durations.get("x", [0], unit="s"), first)
+        self.assertEqual(len(durations._converted_durations), 1)
+
+    def test_cached_conversion_follows_dt_update(self):
+        durations = InstructionDurations([("x", [0], 160, "dt")], dt=1e-9)
+        self.assertAlmostEqual(durations.get("x", [0], unit="s"), 1.6e-7)
+        durations.update(None, dt=2e-9)
+        self.assertAlmostEqual(durations.get("x", [0], unit="s"), 3.2e-7)
+
+    def test_cached_conversion_keeps_duration_type(self):
+        durations = InstructionDurations([("x", [0], 1, "s"), ("y", [0], 1.0, "s")])
+        self.assertIsInstance(durations.get("x", [0], unit="s"), int)
+        self.assertIsInstance(durations.get("y", [0], unit="s"), float)
+
+    def test_delay_durations_are_not_cached(self):
+        durations = InstructionDurations(dt=1e-9)
+        for duration in range(1, 10):
+            self.assertEqual(durations.get(Delay(duration, "dt"), 0), duration)
+        self.assertEqual(durations._converted_durations, {})